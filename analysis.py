@@ -0,0 +1,230 @@
+import statistics
+from collections import defaultdict
+from datetime import datetime
+
+def analyze_tx_quality(txs):
+    if not txs:
+        return {
+            "frequency_per_month": {},
+            "frequency_per_year": {},
+            "failure_rate": 1.0,
+            "avg_tx_value_usd": 0.0,
+        }
+
+    dates = [datetime.fromisoformat(tx["block_signed_at"]) for tx in txs if tx.get("block_signed_at")]
+    freq_month = defaultdict(int)
+    freq_year = defaultdict(int)
+    for d in dates:
+        freq_month[d.strftime("%Y-%m")] += 1
+        freq_year[d.year] += 1
+
+    total_txs = len(txs)
+    failures = sum(1 for tx in txs if not tx.get("successful", True))
+    failure_rate = failures / total_txs if total_txs > 0 else 0
+
+    total_value_usd = sum(tx.get("value_quote", 0) for tx in txs)
+    avg_value_usd = total_value_usd / total_txs if total_txs > 0 else 0
+
+    return {
+        "frequency_per_month": dict(freq_month),
+        "frequency_per_year": dict(freq_year),
+        "failure_rate": failure_rate,
+        "avg_tx_value_usd": avg_value_usd,
+    }
+
+def analyze_diversification(txs, balances):
+    unique_to_addresses = {tx["to_address"].lower() for tx in txs if tx.get("to_address")}
+    unique_tokens = {token.get("contract_address") for token in balances if token.get("contract_address")}
+    return {
+        "unique_tokens_held": len(unique_tokens),
+        "unique_to_addresses": len(unique_to_addresses),
+    }
+
+def analyze_gas_usage(txs):
+    gas_prices = [float(tx.get("gas_price", 0)) for tx in txs if tx.get("gas_price")]
+    if not gas_prices:
+        return {"avg_gas_price": 0, "median_gas_price": 0, "gas_price_ratio": 0}
+    
+    gas_prices.sort()
+    n = len(gas_prices)
+    avg_gas = statistics.mean(gas_prices)
+    median_gas = statistics.median(gas_prices)
+    gas_price_ratio = avg_gas / median_gas if median_gas > 0 else 0
+    
+    return {
+        "avg_gas_price": avg_gas,
+        "median_gas_price": median_gas,
+        "gas_price_ratio": gas_price_ratio,
+    }
+
+def analyze_total_balance(balances):
+    total_balance_usd = sum(token.get("quote", 0.0) or 0.0 for token in balances)
+    return {"total_balance_usd": total_balance_usd}
+
+def analyze_incoming_outgoing(txs, address):
+    address = address.lower()
+    incoming_count, outgoing_count = 0, 0
+    incoming_value, outgoing_value = 0.0, 0.0
+
+    for tx in txs:
+        value = tx.get("value_quote", 0.0)
+        if tx.get("to_address", "").lower() == address:
+            incoming_count += 1
+            incoming_value += value
+        if tx.get("from_address", "").lower() == address:
+            outgoing_count += 1
+            outgoing_value += value
+            
+    return {
+        "incoming_count": incoming_count,
+        "outgoing_count": outgoing_count,
+        "incoming_value_usd": incoming_value,
+        "outgoing_value_usd": outgoing_value,
+        "io_count_ratio": (incoming_count / outgoing_count) if outgoing_count > 0 else None,
+        "io_value_ratio": (incoming_value / outgoing_value) if outgoing_value > 0 else None,
+    }
+
+def analyze_inter_tx_time(txs):
+    if len(txs) < 2:
+        return {"avg_inter_tx_seconds": None, "std_inter_tx_seconds": None}
+
+    dates = sorted([datetime.fromisoformat(tx["block_signed_at"]) for tx in txs if tx.get("block_signed_at")])
+    if len(dates) < 2:
+        return {"avg_inter_tx_seconds": None, "std_inter_tx_seconds": None}
+
+    diffs_seconds = [(dates[i+1] - dates[i]).total_seconds() for i in range(len(dates)-1)]
+    
+    return {
+        "avg_inter_tx_seconds": statistics.mean(diffs_seconds),
+        "std_inter_tx_seconds": statistics.stdev(diffs_seconds) if len(diffs_seconds) > 1 else 0,
+    }
+
+
+class TxFeatureExtractor:
+    def __init__(self, address: str):
+        self.address = address.lower()
+        self.tx_count = 0
+        self.dated_count = 0
+        self.month_counts = {}
+        self.year_counts = {}
+        self.dates = []
+        self.failures = 0
+        self.total_value = 0
+        self.to_addresses = set()
+        self.gas_prices = []
+        self.incoming_count = 0
+        self.outgoing_count = 0
+        self.incoming_value = 0.0
+        self.outgoing_value = 0.0
+
+    def add(self, tx: dict):
+        self.tx_count += 1
+
+        signed_at = tx.get("block_signed_at")
+        if signed_at:
+            d = datetime.fromisoformat(signed_at)
+            self.dates.append(d)
+            month = (d.year, d.month)
+            self.month_counts[month] = self.month_counts.get(month, 0) + 1
+            self.year_counts[d.year] = self.year_counts.get(d.year, 0) + 1
+
+        if not tx.get("successful", True):
+            self.failures += 1
+
+        self.total_value += tx.get("value_quote", 0)
+
+        gas_price = tx.get("gas_price")
+        if gas_price:
+            self.gas_prices.append(float(gas_price))
+
+        value = tx.get("value_quote", 0.0)
+        to_address = tx.get("to_address")
+        if to_address:
+            to_address = to_address.lower()
+            self.to_addresses.add(to_address)
+            if to_address == self.address:
+                self.incoming_count += 1
+                self.incoming_value += value
+        from_address = tx.get("from_address")
+        if from_address and from_address.lower() == self.address:
+            self.outgoing_count += 1
+            self.outgoing_value += value
+
+    def add_many(self, txs):
+        for tx in txs:
+            self.add(tx)
+
+    def tx_quality(self) -> dict:
+        if not self.tx_count:
+            return {
+                "frequency_per_month": {},
+                "frequency_per_year": {},
+                "failure_rate": 1.0,
+                "avg_tx_value_usd": 0.0,
+            }
+
+        return {
+            "frequency_per_month": {
+                datetime(year, month, 1).strftime("%Y-%m"): count
+                for (year, month), count in self.month_counts.items()
+            },
+            "frequency_per_year": dict(self.year_counts),
+            "failure_rate": self.failures / self.tx_count,
+            "avg_tx_value_usd": self.total_value / self.tx_count,
+        }
+
+    def diversification(self, balances) -> dict:
+        unique_tokens = {token.get("contract_address") for token in balances if token.get("contract_address")}
+        return {
+            "unique_tokens_held": len(unique_tokens),
+            "unique_to_addresses": len(self.to_addresses),
+        }
+
+    def gas_usage(self) -> dict:
+        if not self.gas_prices:
+            return {"avg_gas_price": 0, "median_gas_price": 0, "gas_price_ratio": 0}
+
+        gas_prices = sorted(self.gas_prices)
+        avg_gas = statistics.mean(gas_prices)
+        median_gas = statistics.median(gas_prices)
+        return {
+            "avg_gas_price": avg_gas,
+            "median_gas_price": median_gas,
+            "gas_price_ratio": avg_gas / median_gas if median_gas > 0 else 0,
+        }
+
+    def incoming_outgoing(self) -> dict:
+        return {
+            "incoming_count": self.incoming_count,
+            "outgoing_count": self.outgoing_count,
+            "incoming_value_usd": self.incoming_value,
+            "outgoing_value_usd": self.outgoing_value,
+            "io_count_ratio": (self.incoming_count / self.outgoing_count) if self.outgoing_count > 0 else None,
+            "io_value_ratio": (self.incoming_value / self.outgoing_value) if self.outgoing_value > 0 else None,
+        }
+
+    def inter_tx_time(self) -> dict:
+        if self.tx_count < 2 or len(self.dates) < 2:
+            return {"avg_inter_tx_seconds": None, "std_inter_tx_seconds": None}
+
+        dates = sorted(self.dates)
+        diffs_seconds = [(dates[i+1] - dates[i]).total_seconds() for i in range(len(dates)-1)]
+        return {
+            "avg_inter_tx_seconds": statistics.mean(diffs_seconds),
+            "std_inter_tx_seconds": statistics.stdev(diffs_seconds) if len(diffs_seconds) > 1 else 0,
+        }
+
+    def result(self, balances) -> dict:
+        return {
+            "tx_quality": self.tx_quality(),
+            "diversification": self.diversification(balances),
+            "gas_usage": self.gas_usage(),
+            "total_balance": analyze_total_balance(balances),
+            "incoming_outgoing": self.incoming_outgoing(),
+            "inter_transaction_time": self.inter_tx_time(),
+        }
+
+def extract_tx_features(txs, balances, address: str) -> dict:
+    extractor = TxFeatureExtractor(address)
+    extractor.add_many(txs)
+    return extractor.result(balances)
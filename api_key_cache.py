@@ -0,0 +1,157 @@
+import asyncio
+import logging
+from collections import namedtuple
+from datetime import datetime, timezone
+from sqlalchemy import bindparam, insert
+from starlette.concurrency import run_in_threadpool
+from cache import EntryCache
+from database import SessionLocal
+from models.api_key import APIKey
+from models.api_usage import APIUsageRollup
+import config as settings
+import metrics
+
+logger = logging.getLogger(__name__)
+
+CachedAPIKey = namedtuple("CachedAPIKey", ["id", "key", "owner_id", "rate_per_second", "rate_burst"])
+
+def minute_bucket(moment: datetime) -> datetime:
+    return moment.replace(second=0, microsecond=0)
+
+class UsageCounters:
+    def __init__(self):
+        self._pending = {}
+        self._rollups = {}
+
+    def record(self, key_id: int, calls: int = 0, success: int = 0, errors: int = 0, latency_ms: float = None):
+        counts = self._pending.setdefault(key_id, [0, 0, 0])
+        counts[0] += calls
+        counts[1] += success
+        counts[2] += errors
+
+        bucket = minute_bucket(datetime.now(timezone.utc))
+        self._merge_rollup((key_id, bucket), calls, success, errors, [] if latency_ms is None else [latency_ms])
+
+    def _merge_rollup(self, key: tuple, calls: int, success: int, errors: int, latencies: list):
+        rollup = self._rollups.setdefault(key, [0, 0, 0, []])
+        rollup[0] += calls
+        rollup[1] += success
+        rollup[2] += errors
+        rollup[3].extend(latencies)
+
+    def pending(self) -> int:
+        return len(self._pending) + len(self._rollups)
+
+    def discard(self, key_id: int):
+        self._pending.pop(key_id, None)
+        for key in [key for key in self._rollups if key[0] == key_id]:
+            del self._rollups[key]
+
+    async def flush(self, final: bool = False):
+        pending, self._pending = self._pending, {}
+
+        # Only finished minutes are written, so each worker writes one row
+        # per key and minute instead of one per flush.
+        current_bucket = minute_bucket(datetime.now(timezone.utc))
+        closed = {key: rollup for key, rollup in self._rollups.items() if final or key[1] < current_bucket}
+        for key in closed:
+            del self._rollups[key]
+
+        if not pending and not closed:
+            return
+        try:
+            await run_in_threadpool(write_usage, pending, closed)
+        except Exception:
+            for key_id, (calls, success, errors) in pending.items():
+                counts = self._pending.setdefault(key_id, [0, 0, 0])
+                counts[0] += calls
+                counts[1] += success
+                counts[2] += errors
+            for key, rollup in closed.items():
+                self._merge_rollup(key, *rollup)
+            raise
+
+def fetch_api_key(key: str):
+    with SessionLocal() as db:
+        row = (
+            db.query(APIKey.id, APIKey.key, APIKey.owner_id, APIKey.rate_limit_per_second, APIKey.rate_limit_burst)
+            .filter(APIKey.key == key)
+            .first()
+        )
+        return CachedAPIKey(*row) if row else None
+
+def rollup_row(key_id: int, bucket: datetime, rollup: list) -> dict:
+    calls, success, errors, latencies = rollup
+    latencies = sorted(latencies)
+    return {
+        "api_key_id": key_id,
+        "bucket": bucket,
+        "calls": calls,
+        "successes": success,
+        "errors": errors,
+        "latency_p50_ms": metrics.percentile(latencies, 0.50),
+        "latency_p95_ms": metrics.percentile(latencies, 0.95),
+        "latency_p99_ms": metrics.percentile(latencies, 0.99),
+        "latency_max_ms": latencies[-1] if latencies else None,
+    }
+
+def write_usage(pending: dict, rollups: dict):
+    api_keys = APIKey.__table__
+    stmt = (
+        api_keys.update()
+        .where(api_keys.c.id == bindparam("b_id"))
+        .values(
+            total_calls=api_keys.c.total_calls + bindparam("b_calls"),
+            total_success=api_keys.c.total_success + bindparam("b_success"),
+            total_errors=api_keys.c.total_errors + bindparam("b_errors"),
+        )
+    )
+    with SessionLocal() as db:
+        if pending:
+            db.execute(stmt, [
+                {"b_id": key_id, "b_calls": calls, "b_success": success, "b_errors": errors}
+                for key_id, (calls, success, errors) in pending.items()
+            ])
+        if rollups:
+            # Keys deleted since the usage was recorded (possibly on another
+            # worker) are skipped, and the surviving keys are locked against
+            # deletion until commit, so one stale row cannot fail the batch.
+            key_ids = {key_id for key_id, _ in rollups}
+            existing = {
+                key_id for (key_id,) in
+                db.query(APIKey.id).filter(APIKey.id.in_(key_ids)).with_for_update(key_share=True)
+            }
+            rows = [
+                rollup_row(key_id, bucket, rollup)
+                for (key_id, bucket), rollup in rollups.items()
+                if key_id in existing
+            ]
+            if rows:
+                db.execute(insert(APIUsageRollup), rows)
+        db.commit()
+
+api_key_cache = EntryCache(settings.API_KEY_CACHE_TTL, settings.API_KEY_CACHE_MAX_ENTRIES)
+usage_counters = UsageCounters()
+metrics.register("api_key_cache", api_key_cache.stats)
+metrics.register("api_usage_counters", lambda: {"pending_keys": usage_counters.pending()})
+
+async def lookup_api_key(key: str):
+    cached = api_key_cache.get(key)
+    if cached is not None:
+        return cached
+
+    cached = await run_in_threadpool(fetch_api_key, key)
+    if cached is not None:
+        api_key_cache.set(key, cached)
+    return cached
+
+async def run_usage_flusher():
+    try:
+        while True:
+            await asyncio.sleep(settings.API_USAGE_FLUSH_INTERVAL)
+            try:
+                await usage_counters.flush()
+            except Exception:
+                logger.exception("Failed to flush API key usage counters")
+    finally:
+        await usage_counters.flush(final=True)
@@ -1,25 +1,21 @@
+from collections import namedtuple
 from datetime import datetime, timedelta
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy import event, inspect
+from starlette.concurrency import run_in_threadpool
+from cache import EntryCache
+from database import SessionLocal
 from models.user import User
+from revocation import check_revoked
 import config as settings
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import metrics
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + (
@@ -34,9 +30,29 @@ def create_refresh_token(data: dict) -> str:
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
+CachedPrincipal = namedtuple("CachedPrincipal", ["id", "email", "is_active"])
+
+principal_cache = EntryCache(settings.PRINCIPAL_CACHE_TTL, settings.PRINCIPAL_CACHE_MAX_ENTRIES)
+metrics.register("principal_cache", principal_cache.stats)
+
+def fetch_principal(user_id: int):
+    with SessionLocal() as db:
+        row = db.query(User.id, User.email, User.is_active).filter(User.id == user_id).first()
+        return CachedPrincipal(*row) if row else None
+
+def invalidate_principal(user_id: int):
+    principal_cache.invalidate(user_id)
+
+@event.listens_for(User.is_active, "set")
+def invalidate_on_deactivation(target, value, oldvalue, initiator):
+    if inspect(target).persistent and value != oldvalue:
+        invalidate_principal(target.id)
+
+@event.listens_for(User, "after_delete")
+def invalidate_on_delete(mapper, connection, target):
+    invalidate_principal(target.id)
+
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -47,13 +63,21 @@ def get_current_user(
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        user_id: int = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+        user_id = int(payload.get("sub"))
+    except (JWTError, TypeError, ValueError):
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+    jti = payload.get("jti")
+    if jti and await check_revoked(jti):
+        raise credentials_exception
+
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        principal = await run_in_threadpool(fetch_principal, user_id)
+        if principal is None:
+            raise credentials_exception
+        principal_cache.set(user_id, principal)
+
+    if principal.is_active is False:
         raise credentials_exception
-    return user
\ No newline at end of file
+    return User(id=principal.id, email=principal.email, is_active=principal.is_active)
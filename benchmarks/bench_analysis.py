@@ -0,0 +1,82 @@
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis import (
+    analyze_diversification,
+    analyze_gas_usage,
+    analyze_incoming_outgoing,
+    analyze_inter_tx_time,
+    analyze_total_balance,
+    analyze_tx_quality,
+    extract_tx_features,
+)
+
+ADDRESS = "0x3f5ce5fbfe3e9af3971dd833d26ba9b5c936f0be"
+SIZES = (100, 10_000, 100_000)
+
+def make_txs(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    start = datetime(2019, 1, 1, tzinfo=timezone.utc)
+    counterparties = [f"0x{rng.getrandbits(160):040x}" for _ in range(500)]
+    txs = []
+    for _ in range(n):
+        other = rng.choice(counterparties)
+        outgoing = rng.random() < 0.5
+        signed_at = start + timedelta(seconds=rng.randrange(0, 6 * 365 * 86400))
+        txs.append({
+            "block_signed_at": signed_at.isoformat().replace("+00:00", "Z"),
+            "successful": rng.random() > 0.05,
+            "value_quote": rng.random() * 5000,
+            "gas_price": rng.randrange(1, 200) * 10**9,
+            "from_address": ADDRESS.upper() if outgoing else other,
+            "to_address": other if outgoing else ADDRESS,
+        })
+    return txs
+
+def make_balances(n: int = 25) -> list:
+    return [{"contract_address": f"0x{i:040x}", "quote": float(i)} for i in range(n)]
+
+def run_separate(txs, balances):
+    return {
+        "tx_quality": analyze_tx_quality(txs),
+        "diversification": analyze_diversification(txs, balances),
+        "gas_usage": analyze_gas_usage(txs),
+        "total_balance": analyze_total_balance(balances),
+        "incoming_outgoing": analyze_incoming_outgoing(txs, ADDRESS),
+        "inter_transaction_time": analyze_inter_tx_time(txs),
+    }
+
+def run_fused(txs, balances):
+    return extract_tx_features(txs, balances, ADDRESS)
+
+def best_of(fn, *args, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    balances = make_balances()
+    print(f"{'txs':>8} {'separate ms':>12} {'fused ms':>10} {'speedup':>8}")
+    for n in SIZES:
+        txs = make_txs(n)
+        expected = json.dumps(run_separate(txs, balances))
+        actual = json.dumps(run_fused(txs, balances))
+        if actual != expected:
+            raise SystemExit(f"fused output differs from separate analyzers at {n} txs")
+
+        repeat = 50 if n <= 1000 else 5
+        separate = best_of(run_separate, txs, balances, repeat=repeat)
+        fused = best_of(run_fused, txs, balances, repeat=repeat)
+        print(f"{n:>8} {separate * 1000:>12.2f} {fused * 1000:>10.2f} {separate / fused:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must stay out of the startup path; they are imported on first use.
+DEFERRED_MODULES = ("covalent", "web3")
+
+def measure_import(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{result.stderr}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        timings[name.strip()] = int(cumulative_us)
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail if importing the API process exceeds its startup budget.")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_BUDGET_MS", 1500)))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [measure_import(args.module) for _ in range(args.runs)]
+    best = min(runs, key=lambda timings: timings[args.module])
+    total_ms = best[args.module] / 1000
+
+    print(f"import {args.module}: {total_ms:.1f} ms (best of {args.runs}, budget {args.budget_ms:.0f} ms)")
+    top_level = sorted(
+        ((name, us) for name, us in best.items() if "." not in name and name != args.module),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    for name, us in top_level[: args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    failures = []
+    loaded = [name for name in DEFERRED_MODULES if name in best]
+    if loaded:
+        failures.append(f"deferred modules imported at startup: {', '.join(loaded)}")
+    if total_ms > args.budget_ms:
+        failures.append(f"startup import took {total_ms:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+
+class TTLCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._refreshing = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def set(self, key, value, ttl: float, stale_ttl: float = 0):
+        size = len(json.dumps(value, default=str))
+        self.delete(key)
+        if size > self.max_bytes:
+            return
+        now = time.monotonic()
+        self._entries[key] = (value, size, now + ttl, now + ttl + stale_ttl)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (_, evicted_size, _, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def delete(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    async def get_or_fetch(self, key, fetch, ttl: float, stale_ttl: float = 0):
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, _, fresh_until, stale_until = entry
+            now = time.monotonic()
+            if now < fresh_until:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return value
+            if now < stale_until:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._refreshing:
+                    self._refreshing[key] = asyncio.create_task(
+                        self._refresh(key, fetch, ttl, stale_ttl)
+                    )
+                return value
+
+        self.misses += 1
+        value = await fetch()
+        self.set(key, value, ttl, stale_ttl)
+        return value
+
+    async def _refresh(self, key, fetch, ttl: float, stale_ttl: float):
+        try:
+            self.set(key, await fetch(), ttl, stale_ttl)
+        except Exception:
+            pass
+        finally:
+            self._refreshing.pop(key, None)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+        }
+
+class EntryCache:
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def __contains__(self, key) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[1] > time.monotonic()
+
+    def set(self, key, value):
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        self._entries.pop(key, None)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,30 @@
+import hashlib
+from collections import namedtuple
+import orjson
+
+Chain = namedtuple("Chain", ["name", "c_id", "icon_name", "category"])
+
+class ChainRegistry:
+    def __init__(self, grouped: dict):
+        self.by_name = {}
+        self.by_c_id = {}
+        self.by_category = {}
+        for category, entries in grouped.items():
+            for name, entry in entries.items():
+                chain = Chain(name, entry["c_id"], entry["icon_name"], category)
+                self.by_name[name] = chain
+                self.by_c_id[chain.c_id] = chain
+                self.by_category.setdefault(category, []).append(chain)
+
+        self.body = orjson.dumps(grouped)
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+
+    def __len__(self) -> int:
+        return len(self.by_c_id)
+
+    def resolve(self, chain: str):
+        key = chain.strip().lower()
+        return self.by_c_id.get(key) or self.by_name.get(key)
+
+    def is_supported(self, chain: str) -> bool:
+        return self.resolve(chain) is not None
@@ -15,4 +15,86 @@ REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 30))
 
 LLM_API_KEY = os.getenv("LLM_API_KEY", "")
 
-DEBUG = os.getenv("DEBUG", "false").lower() == "true"
\ No newline at end of file
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
+GOLDRUSH_TIMEOUT = float(os.getenv("GOLDRUSH_TIMEOUT", 15))
+GOLDRUSH_CONNECT_TIMEOUT = float(os.getenv("GOLDRUSH_CONNECT_TIMEOUT", 5))
+GOLDRUSH_MAX_CONNECTIONS = int(os.getenv("GOLDRUSH_MAX_CONNECTIONS", 100))
+GOLDRUSH_MAX_KEEPALIVE = int(os.getenv("GOLDRUSH_MAX_KEEPALIVE", 20))
+GOLDRUSH_KEEPALIVE_EXPIRY = float(os.getenv("GOLDRUSH_KEEPALIVE_EXPIRY", 30))
+GOLDRUSH_HTTP2 = os.getenv("GOLDRUSH_HTTP2", "false").lower() == "true"
+
+GOLDRUSH_CACHE_MAX_BYTES = int(os.getenv("GOLDRUSH_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+GOLDRUSH_CACHE_TTL_TRANSACTIONS = float(os.getenv("GOLDRUSH_CACHE_TTL_TRANSACTIONS", 120))
+GOLDRUSH_CACHE_TTL_BALANCES = float(os.getenv("GOLDRUSH_CACHE_TTL_BALANCES", 60))
+GOLDRUSH_CACHE_TTL_SUMMARY = float(os.getenv("GOLDRUSH_CACHE_TTL_SUMMARY", 600))
+GOLDRUSH_CACHE_STALE_TTL = float(os.getenv("GOLDRUSH_CACHE_STALE_TTL", 300))
+
+SCORE_BATCH_MAX_ITEMS = int(os.getenv("SCORE_BATCH_MAX_ITEMS", 500))
+SCORE_BATCH_CONCURRENCY = int(os.getenv("SCORE_BATCH_CONCURRENCY", 8))
+SCORE_MULTICHAIN_MAX_CHAINS = int(os.getenv("SCORE_MULTICHAIN_MAX_CHAINS", 10))
+
+GOLDRUSH_PAGE_SIZE = int(os.getenv("GOLDRUSH_PAGE_SIZE", 100))
+SCORE_MAX_TX_LIMIT = int(os.getenv("SCORE_MAX_TX_LIMIT", 10000))
+TX_STORE_SCAN_BATCH = int(os.getenv("TX_STORE_SCAN_BATCH", 500))
+
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", 1024))
+
+SCORE_SNAPSHOT_TTL = int(os.getenv("SCORE_SNAPSHOT_TTL", 900))
+
+SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "false").lower() == "true"
+SCHEDULER_INTERVAL = int(os.getenv("SCHEDULER_INTERVAL", 60))
+SCHEDULER_BATCH_SIZE = int(os.getenv("SCHEDULER_BATCH_SIZE", 500))
+SCHEDULER_WORKERS = int(os.getenv("SCHEDULER_WORKERS", 4))
+SCHEDULER_RATE_PER_SECOND = float(os.getenv("SCHEDULER_RATE_PER_SECOND", 2))
+SCHEDULER_RESCORE_AFTER = int(os.getenv("SCHEDULER_RESCORE_AFTER", 600))
+SCHEDULER_TX_LIMIT = int(os.getenv("SCHEDULER_TX_LIMIT", 100))
+SCHEDULER_RETRY_BASE = float(os.getenv("SCHEDULER_RETRY_BASE", 300))
+SCHEDULER_RETRY_MAX = float(os.getenv("SCHEDULER_RETRY_MAX", 6 * 3600))
+
+API_KEY_CACHE_TTL = float(os.getenv("API_KEY_CACHE_TTL", 60))
+API_KEY_CACHE_MAX_ENTRIES = int(os.getenv("API_KEY_CACHE_MAX_ENTRIES", 10000))
+API_USAGE_FLUSH_INTERVAL = float(os.getenv("API_USAGE_FLUSH_INTERVAL", 5))
+
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0")
+RATE_LIMIT_MAX_BUCKETS = int(os.getenv("RATE_LIMIT_MAX_BUCKETS", 100000))
+API_KEY_RATE_PER_SECOND = float(os.getenv("API_KEY_RATE_PER_SECOND", 2))
+API_KEY_RATE_BURST = int(os.getenv("API_KEY_RATE_BURST", 20))
+UPSTREAM_BUDGET_PER_SECOND = float(os.getenv("UPSTREAM_BUDGET_PER_SECOND", 50))
+UPSTREAM_BUDGET_BURST = int(os.getenv("UPSTREAM_BUDGET_BURST", 300))
+
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", 30))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", 10000))
+
+REVOCATION_BLOOM_CAPACITY = int(os.getenv("REVOCATION_BLOOM_CAPACITY", 100000))
+REVOCATION_BLOOM_ERROR_RATE = float(os.getenv("REVOCATION_BLOOM_ERROR_RATE", 0.01))
+REVOCATION_POLL_INTERVAL = float(os.getenv("REVOCATION_POLL_INTERVAL", 10))
+REVOCATION_PURGE_INTERVAL = float(os.getenv("REVOCATION_PURGE_INTERVAL", 3600))
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", 4))
+HASH_MAX_PENDING = int(os.getenv("HASH_MAX_PENDING", 64))
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DATABASE_ASYNC = os.getenv("DATABASE_ASYNC", "false").lower() == "true"
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL", DATABASE_URL.replace("postgresql://", "postgresql+psycopg://", 1)
+)
+
+DB_CREATE_SCHEMA_ON_STARTUP = os.getenv("DB_CREATE_SCHEMA_ON_STARTUP", "true").lower() == "true"
+
+VERIFY_CACHE_TTL = float(os.getenv("VERIFY_CACHE_TTL", 3600))
+VERIFY_NEGATIVE_CACHE_TTL = float(os.getenv("VERIFY_NEGATIVE_CACHE_TTL", 300))
+VERIFY_CACHE_MAX_ENTRIES = int(os.getenv("VERIFY_CACHE_MAX_ENTRIES", 50000))
+
+WALLET_IMPORT_MAX_ROWS = int(os.getenv("WALLET_IMPORT_MAX_ROWS", 5000))
+WALLET_IMPORT_MAX_BYTES = int(os.getenv("WALLET_IMPORT_MAX_BYTES", 2 * 1024 * 1024))
+WALLET_IMPORT_CONCURRENCY = int(os.getenv("WALLET_IMPORT_CONCURRENCY", 16))
+
+WALLETS_PAGE_SIZE = int(os.getenv("WALLETS_PAGE_SIZE", 100))
+WALLETS_PAGE_MAX = int(os.getenv("WALLETS_PAGE_MAX", 1000))
@@ -0,0 +1,106 @@
+import httpx
+import config as settings
+import metrics
+from cache import TTLCache
+
+GOLDRUSH_API_KEY = settings.COVALENT_API_KEY
+GOLDRUSH_BASE_URL = "https://api.covalenthq.com/v1"
+HEADERS = {"Authorization": f"Bearer {GOLDRUSH_API_KEY}"}
+
+class GoldRushError(Exception):
+    pass
+
+class GoldRushClient:
+    def __init__(self, base_url: str = GOLDRUSH_BASE_URL, headers: dict = HEADERS):
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=httpx.Timeout(
+                settings.GOLDRUSH_TIMEOUT, connect=settings.GOLDRUSH_CONNECT_TIMEOUT
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.GOLDRUSH_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.GOLDRUSH_MAX_KEEPALIVE,
+                keepalive_expiry=settings.GOLDRUSH_KEEPALIVE_EXPIRY,
+            ),
+            http2=settings.GOLDRUSH_HTTP2,
+        )
+
+    async def get(self, path: str, params: dict = None, timeout: float = None) -> httpx.Response:
+        if timeout is None:
+            return await self._client.get(path, params=params)
+        return await self._client.get(path, params=params, timeout=timeout)
+
+    async def get_data(self, path: str, params: dict = None, timeout: float = None) -> dict:
+        resp = await self.get(path, params=params, timeout=timeout)
+        resp.raise_for_status()
+        return resp.json().get("data", {}) or {}
+
+    async def get_items(self, path: str, params: dict = None, timeout: float = None) -> list:
+        data = await self.get_data(path, params=params, timeout=timeout)
+        return data.get("items", [])
+
+    async def aclose(self):
+        await self._client.aclose()
+
+client = GoldRushClient()
+
+cache = TTLCache(settings.GOLDRUSH_CACHE_MAX_BYTES)
+metrics.register("goldrush_cache", cache.stats)
+
+async def get_goldrush_transactions_page(address: str, chain: str, page_size: int, before: str = None):
+    params = {
+        "chains": chain,
+        "addresses": address,
+        "limit": page_size,
+        "no-logs": "true"
+    }
+    if before:
+        params["before"] = before
+    return await cache.get_or_fetch(
+        ("transactions", chain, address, page_size, before),
+        lambda: client.get_data("/allchains/transactions/", params=params),
+        ttl=settings.GOLDRUSH_CACHE_TTL_TRANSACTIONS,
+        stale_ttl=settings.GOLDRUSH_CACHE_STALE_TTL,
+    )
+
+async def iter_goldrush_transactions(address: str, chain: str, tx_limit: int):
+    remaining = min(tx_limit, settings.SCORE_MAX_TX_LIMIT)
+    before = None
+    while remaining > 0:
+        data = await get_goldrush_transactions_page(
+            address, chain, min(settings.GOLDRUSH_PAGE_SIZE, remaining), before
+        )
+        items = (data.get("items") or [])[:remaining]
+        if not items:
+            return
+        yield items
+
+        remaining -= len(items)
+        before = data.get("cursor_before")
+        if not before:
+            return
+
+async def get_goldrush_token_balances(address: str, chain: str):
+    return await cache.get_or_fetch(
+        ("balances", chain, address),
+        lambda: client.get_items(f"/{chain}/address/{address}/balances_v2/"),
+        ttl=settings.GOLDRUSH_CACHE_TTL_BALANCES,
+        stale_ttl=settings.GOLDRUSH_CACHE_STALE_TTL,
+    )
+
+async def fetch_transactions_summary(chain_name: str, wallet_address: str):
+    response = await client.get(f"/{chain_name}/address/{wallet_address}/transactions_summary/")
+
+    if response.status_code != 200:
+        raise GoldRushError(f"API request failed: {response.status_code} {response.text}")
+
+    return response.json()
+
+async def get_goldrush_transactions_summary(chain_name: str, wallet_address: str):
+    return await cache.get_or_fetch(
+        ("transactions_summary", chain_name, wallet_address),
+        lambda: fetch_transactions_summary(chain_name, wallet_address),
+        ttl=settings.GOLDRUSH_CACHE_TTL_SUMMARY,
+        stale_ttl=settings.GOLDRUSH_CACHE_STALE_TTL,
+    )
@@ -0,0 +1,74 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException
+from passlib.context import CryptContext
+import config as settings
+import metrics
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+)
+
+class HashingPool:
+    def __init__(self, workers: int, max_pending: int, window: int = 1000):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self.rehashed = 0
+        self._latencies = {"hash": deque(maxlen=window), "verify": deque(maxlen=window)}
+
+    async def run(self, operation: str, fn, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Authentication is busy, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        self.pending += 1
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+            self._latencies[operation].append((time.perf_counter() - started) * 1000)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        stats = {
+            "workers": self.workers,
+            "pending": self.pending,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+        }
+        for operation, latencies in self._latencies.items():
+            ordered = sorted(latencies)
+            stats[operation] = {
+                "samples": len(ordered),
+                "p50_ms": metrics.percentile(ordered, 0.50),
+                "p95_ms": metrics.percentile(ordered, 0.95),
+                "max_ms": ordered[-1] if ordered else None,
+            }
+        return stats
+
+hashing_pool = HashingPool(settings.HASH_WORKERS, settings.HASH_MAX_PENDING)
+metrics.register("password_hashing", hashing_pool.stats)
+
+async def hash_password(password: str) -> str:
+    return await hashing_pool.run("hash", pwd_context.hash, password)
+
+async def verify_password(password: str, hashed_password: str):
+    verified, new_hash = await hashing_pool.run("verify", pwd_context.verify_and_update, password, hashed_password)
+    if verified and new_hash is not None:
+        hashing_pool.rehashed += 1
+    return verified, new_hash
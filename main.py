@@ -1,11 +1,50 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from routes import auth, wallets, chains, score, api
+from goldrush import client as goldrush_client
+import metrics
+import config as settings
+from scheduler import create_scheduler
+from api_key_cache import run_usage_flusher
+from revocation import run_revocation_maintenance
+from hashing import hashing_pool
+from database import async_engine, create_schema, engine
+from starlette.concurrency import run_in_threadpool
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.DB_CREATE_SCHEMA_ON_STARTUP:
+        await run_in_threadpool(create_schema)
+
+    usage_flusher = asyncio.create_task(run_usage_flusher())
+    revocation_maintenance = asyncio.create_task(run_revocation_maintenance())
+
+    prescore_scheduler = None
+    if settings.SCHEDULER_ENABLED:
+        prescore_scheduler = create_scheduler(score.get_score)
+        prescore_scheduler.start()
+
+    yield
+
+    if prescore_scheduler is not None:
+        await prescore_scheduler.stop()
+    usage_flusher.cancel()
+    revocation_maintenance.cancel()
+    await asyncio.gather(usage_flusher, revocation_maintenance, return_exceptions=True)
+    await goldrush_client.aclose()
+    hashing_pool.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
+    engine.dispose()
 
 app = FastAPI(
     title="CryptoCredit API",
     description="Backend for wallet tracking, scoring",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -14,8 +53,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE)
+
 app.include_router(auth.router, tags=["Auth"])
 app.include_router(chains.router, tags=["Chains"])
 app.include_router(wallets.router, tags=["Wallets"])
@@ -24,4 +66,8 @@ app.include_router(api.router, tags=["API"])
 
 @app.get("/")
 async def root():
-    return {"message": "Welcome to the CryptoCredit API"}
\ No newline at end of file
+    return {"message": "Welcome to the CryptoCredit API"}
+
+@app.get("/metrics")
+async def get_metrics():
+    return metrics.snapshot()
\ No newline at end of file
@@ -0,0 +1,15 @@
+import math
+
+_sources = {}
+
+def register(name: str, source):
+    _sources[name] = source
+
+def snapshot() -> dict:
+    return {name: source() for name, source in _sources.items()}
+
+def percentile(sorted_values: list, fraction: float):
+    if not sorted_values:
+        return None
+    index = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
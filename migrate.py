@@ -0,0 +1,5 @@
+from database import create_schema
+
+if __name__ == "__main__":
+    create_schema()
+    print("Database schema is up to date")
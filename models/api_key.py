@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Float, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
 from db_base import Base
 
@@ -14,4 +14,7 @@ class APIKey(Base):
     total_errors = Column(Integer, default=0)
     total_success = Column(Integer, default=0)
 
+    rate_limit_per_second = Column(Float, nullable=True)
+    rate_limit_burst = Column(Integer, nullable=True)
+
     owner = relationship("User", back_populates="api_keys")
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Index
+from db_base import Base
+
+class APIUsageRollup(Base):
+    __tablename__ = "api_usage_rollups"
+
+    id = Column(Integer, primary_key=True, index=True)
+    api_key_id = Column(Integer, ForeignKey("api_keys.id", ondelete="CASCADE"), nullable=False)
+    bucket = Column(DateTime(timezone=True), nullable=False)
+
+    calls = Column(Integer, default=0, nullable=False)
+    successes = Column(Integer, default=0, nullable=False)
+    errors = Column(Integer, default=0, nullable=False)
+
+    latency_p50_ms = Column(Float)
+    latency_p95_ms = Column(Float)
+    latency_p99_ms = Column(Float)
+    latency_max_ms = Column(Float)
+
+    __table_args__ = (
+        Index("ix_api_usage_rollups_key_bucket", "api_key_id", "bucket"),
+    )
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON, UniqueConstraint
+from sqlalchemy.sql import func
+from db_base import Base
+
+class ScoreSnapshot(Base):
+    __tablename__ = "score_snapshots"
+
+    id = Column(Integer, primary_key=True, index=True)
+    address = Column(String, nullable=False)
+    chain = Column(String, nullable=False)
+    tx_limit = Column(Integer, nullable=False)
+    model_version = Column(String, nullable=False)
+    features = Column(JSON, nullable=False)
+    details = Column(JSON, nullable=False)
+    score = Column(Integer, nullable=False)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "chain", "address", "tx_limit", "model_version", name="uq_score_snapshots_wallet_limit_version"
+        ),
+    )
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, DateTime
+from sqlalchemy.sql import func
+from db_base import Base
+
+class WalletSyncCursor(Base):
+    __tablename__ = "wallet_sync_cursors"
+
+    chain = Column(String, primary_key=True)
+    address = Column(String, primary_key=True)
+    last_block_height = Column(BigInteger)
+    backfill_limit = Column(Integer, default=0)
+    history_complete = Column(Boolean, default=False)
+    last_synced_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
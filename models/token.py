@@ -6,4 +6,5 @@ class BlacklistedToken(Base):
     __tablename__ = "blacklisted_tokens"
 
     jti = Column(String, primary_key=True, index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=True, index=True)
\ No newline at end of file
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, String, BigInteger, JSON, ForeignKeyConstraint, Index
+from db_base import Base
+
+class Transaction(Base):
+    __tablename__ = "transactions"
+
+    chain = Column(String, primary_key=True)
+    tx_hash = Column(String, primary_key=True)
+    block_height = Column(BigInteger)
+    data = Column(JSON, nullable=False)
+
+class WalletTransaction(Base):
+    __tablename__ = "wallet_transactions"
+
+    chain = Column(String, primary_key=True)
+    address = Column(String, primary_key=True)
+    tx_hash = Column(String, primary_key=True)
+    block_height = Column(BigInteger)
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["chain", "tx_hash"],
+            ["transactions.chain", "transactions.tx_hash"],
+            ondelete="CASCADE",
+        ),
+        Index("ix_wallet_transactions_wallet_height", "chain", "address", "block_height"),
+    )
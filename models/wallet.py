@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from db_base import Base
 
@@ -9,9 +9,14 @@ class Wallet(Base):
     nickname = Column(String, nullable=False)
     address = Column(String, unique=True, nullable=False)
     chain = Column(String, nullable=False)
+    last_viewed_at = Column(DateTime(timezone=True), nullable=True)
 
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
 
-    owner = relationship("User", back_populates="wallets")
\ No newline at end of file
+    owner = relationship("User", back_populates="wallets")
+
+    __table_args__ = (
+        Index("ix_wallets_user_id_chain_id", "user_id", "chain", "id"),
+    )
@@ -0,0 +1,121 @@
+import math
+import time
+from collections import OrderedDict
+from fastapi import HTTPException
+import config as settings
+import metrics
+
+UPSTREAM_BUDGET_KEY = "upstream:goldrush"
+
+def score_upstream_cost(tx_limit: int, chains: int = 1) -> int:
+    # Balances and the transactions summary are fetched per chain; the
+    # transaction stream is paged once across all of them.
+    pages = math.ceil(min(tx_limit, settings.SCORE_MAX_TX_LIMIT) / settings.GOLDRUSH_PAGE_SIZE)
+    return 2 * chains + max(pages, 1)
+
+class MemoryRateLimitBackend:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._buckets = OrderedDict()
+
+    async def take(self, key: str, rate: float, burst: int, cost: int = 1) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated) * rate)
+
+        if tokens >= cost:
+            tokens -= cost
+            wait = 0.0
+        else:
+            wait = (cost - tokens) / rate
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_entries:
+            self._buckets.popitem(last=False)
+        return wait
+
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - updated) * rate)
+local wait = 0
+if tokens >= cost then
+    tokens = tokens - cost
+else
+    wait = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst - tokens) / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+class RedisRateLimitBackend:
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        import redis.asyncio as redis
+
+        self.prefix = prefix
+        self._redis = redis.from_url(url)
+        self._script = self._redis.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def take(self, key: str, rate: float, burst: int, cost: int = 1) -> float:
+        wait = await self._script(keys=[self.prefix + key], args=[rate, burst, cost])
+        return float(wait)
+
+def create_backend():
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimitBackend(settings.RATE_LIMIT_REDIS_URL)
+    if settings.RATE_LIMIT_BACKEND == "memory":
+        return MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_BUCKETS)
+    raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {settings.RATE_LIMIT_BACKEND}")
+
+backend = create_backend()
+counters = {"key_allowed": 0, "key_limited": 0, "upstream_allowed": 0, "upstream_limited": 0}
+metrics.register("rate_limits", lambda: {"backend": settings.RATE_LIMIT_BACKEND, **counters})
+
+def too_many_requests(wait: float, detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail=detail,
+        headers={"Retry-After": str(max(math.ceil(wait), 1))},
+    )
+
+def over_burst(cost: int, burst: int, detail: str) -> HTTPException:
+    # Buckets never go into debt, so a request costing more than the burst
+    # can never be admitted; retrying it will not help.
+    return HTTPException(status_code=429, detail=f"{detail}: request costs {cost}, the burst is {burst}")
+
+async def enforce_key_limit(api_key, cost: int = 1):
+    rate = api_key.rate_per_second or settings.API_KEY_RATE_PER_SECOND
+    burst = api_key.rate_burst or settings.API_KEY_RATE_BURST
+    if rate <= 0:
+        return
+    if cost > burst:
+        counters["key_limited"] += 1
+        raise over_burst(cost, burst, "API key rate limit exceeded")
+
+    wait = await backend.take(f"key:{api_key.id}", rate, burst, cost)
+    if wait > 0:
+        counters["key_limited"] += 1
+        raise too_many_requests(wait, "API key rate limit exceeded")
+    counters["key_allowed"] += 1
+
+async def enforce_upstream_budget(cost: int):
+    rate = settings.UPSTREAM_BUDGET_PER_SECOND
+    if rate <= 0:
+        return
+    if cost > settings.UPSTREAM_BUDGET_BURST:
+        counters["upstream_limited"] += 1
+        raise over_burst(cost, settings.UPSTREAM_BUDGET_BURST, "Upstream data budget exceeded")
+
+    wait = await backend.take(UPSTREAM_BUDGET_KEY, rate, settings.UPSTREAM_BUDGET_BURST, cost)
+    if wait > 0:
+        counters["upstream_limited"] += 1
+        raise too_many_requests(wait, "Upstream data budget exhausted, retry later")
+    counters["upstream_allowed"] += 1
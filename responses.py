@@ -0,0 +1,47 @@
+import time
+from fastapi.responses import ORJSONResponse
+import metrics
+
+serialization_stats = {"responses": 0, "total_ms": 0.0, "max_ms": 0.0}
+metrics.register("score_serialization", lambda: dict(serialization_stats))
+
+class ScoreJSONResponse(ORJSONResponse):
+    def render(self, content) -> bytes:
+        start = time.perf_counter()
+        body = super().render(content)
+        self.serialization_ms = (time.perf_counter() - start) * 1000
+
+        serialization_stats["responses"] += 1
+        serialization_stats["total_ms"] += self.serialization_ms
+        serialization_stats["max_ms"] = max(serialization_stats["max_ms"], self.serialization_ms)
+        return body
+
+    def init_headers(self, headers=None) -> None:
+        super().init_headers(headers)
+        if hasattr(self, "serialization_ms"):
+            self.raw_headers.append(
+                (b"server-timing", f"serialize;dur={self.serialization_ms:.2f}".encode("latin-1"))
+            )
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+def project_score(result: dict, include_txs: bool = True, fields: list = None) -> dict:
+    if not include_txs:
+        result = {key: value for key, value in result.items() if key != "txs"}
+    if not fields:
+        return result
+
+    projected = {"credit_score": result["credit_score"]}
+    for field in fields:
+        key, _, sub_key = field.partition(".")
+        if key not in result:
+            continue
+        if not sub_key:
+            projected[key] = result[key]
+        elif isinstance(result[key], dict) and sub_key in result[key] and projected.get(key) is not result[key]:
+            projected.setdefault(key, {})[sub_key] = result[key][sub_key]
+    return projected
@@ -0,0 +1,173 @@
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import and_, exists, or_
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from database import SessionLocal
+from models.token import BlacklistedToken
+import config as settings
+import metrics
+
+logger = logging.getLogger(__name__)
+
+POLL_OVERLAP = timedelta(minutes=1)
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(round(self.size / capacity * math.log(2)), 1)
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+def token_expiry(payload: dict):
+    exp = payload.get("exp")
+    return datetime.fromtimestamp(exp, tz=timezone.utc) if exp else None
+
+def revoked_in_db(db: Session, jti: str) -> bool:
+    return db.query(exists().where(BlacklistedToken.jti == jti)).scalar()
+
+def load_revoked_jtis(since: datetime = None):
+    now = datetime.now(timezone.utc)
+    with SessionLocal() as db:
+        query = db.query(BlacklistedToken.jti, BlacklistedToken.created_at).filter(
+            or_(BlacklistedToken.expires_at.is_(None), BlacklistedToken.expires_at > now)
+        )
+        if since is not None:
+            query = query.filter(BlacklistedToken.created_at >= since - POLL_OVERLAP)
+        return query.all()
+
+def purge_expired_tokens() -> int:
+    now = datetime.now(timezone.utc)
+    legacy_cutoff = now - timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    with SessionLocal() as db:
+        deleted = (
+            db.query(BlacklistedToken)
+            .filter(or_(
+                BlacklistedToken.expires_at < now,
+                and_(BlacklistedToken.expires_at.is_(None), BlacklistedToken.created_at < legacy_cutoff),
+            ))
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        return deleted
+
+class RevocationList:
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.ready = False
+        self._filter = BloomFilter(capacity, error_rate)
+        self._watermark = None
+        self._recent = set()
+        self.skipped_lookups = 0
+        self.db_lookups = 0
+        self.false_positives = 0
+
+    def rebuild(self):
+        # Tokens revoked locally while the rows are loading are replayed into
+        # the new filter so a concurrent sign-out is never dropped.
+        self._recent = set()
+        rows = load_revoked_jtis()
+        bloom = BloomFilter(max(self.capacity, 2 * len(rows)), self.error_rate)
+        for jti, _ in rows:
+            bloom.add(jti)
+        # add() runs on the event loop while this runs in a worker thread, so
+        # _recent is copied before iterating, and replayed once more after the
+        # swap to catch tokens that reached the old filter in between.
+        for jti in list(self._recent):
+            bloom.add(jti)
+        self._filter = bloom
+        for jti in list(self._recent):
+            bloom.add(jti)
+        self._watermark = max((created_at for _, created_at in rows if created_at), default=None)
+        self.ready = True
+
+    def poll(self):
+        if self._watermark is None:
+            self.rebuild()
+            return
+        for jti, created_at in load_revoked_jtis(self._watermark):
+            self._filter.add(jti)
+            if created_at and created_at > self._watermark:
+                self._watermark = created_at
+
+    def add(self, jti: str):
+        self._recent.add(jti)
+        self._filter.add(jti)
+
+    def might_be_revoked(self, jti: str) -> bool:
+        if self.ready and jti not in self._filter:
+            self.skipped_lookups += 1
+            return False
+        self.db_lookups += 1
+        return True
+
+    def record_lookup(self, revoked: bool) -> bool:
+        if not revoked and self.ready:
+            self.false_positives += 1
+        return revoked
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "entries": self._filter.count,
+            "bloom_bits": self._filter.size,
+            "skipped_lookups": self.skipped_lookups,
+            "db_lookups": self.db_lookups,
+            "false_positives": self.false_positives,
+        }
+
+revocations = RevocationList(settings.REVOCATION_BLOOM_CAPACITY, settings.REVOCATION_BLOOM_ERROR_RATE)
+metrics.register("token_revocations", revocations.stats)
+
+def is_revoked(db: Session, jti: str) -> bool:
+    if not revocations.might_be_revoked(jti):
+        return False
+    return revocations.record_lookup(revoked_in_db(db, jti))
+
+def lookup_revoked(jti: str) -> bool:
+    with SessionLocal() as db:
+        return revoked_in_db(db, jti)
+
+async def check_revoked(jti: str) -> bool:
+    if not revocations.might_be_revoked(jti):
+        return False
+    return revocations.record_lookup(await run_in_threadpool(lookup_revoked, jti))
+
+def revoke(db: Session, payload: dict):
+    db.add(BlacklistedToken(jti=payload["jti"], expires_at=token_expiry(payload)))
+
+async def run_revocation_maintenance():
+    last_purge = time.monotonic()
+    while True:
+        try:
+            if not revocations.ready:
+                await run_in_threadpool(revocations.rebuild)
+            elif time.monotonic() - last_purge >= settings.REVOCATION_PURGE_INTERVAL:
+                purged = await run_in_threadpool(purge_expired_tokens)
+                last_purge = time.monotonic()
+                logger.info("Purged %d expired revoked tokens", purged)
+                await run_in_threadpool(revocations.rebuild)
+            else:
+                await run_in_threadpool(revocations.poll)
+        except Exception:
+            logger.exception("Failed to refresh token revocation list")
+        await asyncio.sleep(settings.REVOCATION_POLL_INTERVAL)
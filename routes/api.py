@@ -1,10 +1,15 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import and_, func
 from sqlalchemy.orm import Session
 from database import get_db
 from models.api_key import APIKey
+from models.api_usage import APIUsageRollup
 from models.user import User
 from auth_deps import get_current_user
 from utils import generate_api_key
+from api_key_cache import api_key_cache, usage_counters
 
 router = APIRouter(prefix="/api", tags=["API"])
 
@@ -44,30 +49,137 @@ def delete_api_key(key_id: int, db: Session = Depends(get_db), user: User = Depe
         raise HTTPException(status_code=404, detail="API key not found")
     db.delete(key)
     db.commit()
+    api_key_cache.invalidate(key.key)
+    usage_counters.discard(key_id)
     return {"message": "API key deleted"}
 
+def usage_range(start: Optional[datetime], end: Optional[datetime]) -> list:
+    conditions = []
+    if start is not None:
+        conditions.append(APIUsageRollup.bucket >= start)
+    if end is not None:
+        conditions.append(APIUsageRollup.bucket < end)
+    return conditions
+
 @router.get("/analytics")
-def get_api_analytics(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    total_calls = db.query(APIKey.total_calls).filter(APIKey.owner_id == user.id).all()
-    total_errors = db.query(APIKey.total_errors).filter(APIKey.owner_id == user.id).all()
-    total_success = db.query(APIKey.total_success).filter(APIKey.owner_id == user.id).all()
+def get_api_analytics(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    if start is None and end is None:
+        total_calls, total_errors, total_success = (
+            db.query(
+                func.coalesce(func.sum(APIKey.total_calls), 0),
+                func.coalesce(func.sum(APIKey.total_errors), 0),
+                func.coalesce(func.sum(APIKey.total_success), 0),
+            )
+            .filter(APIKey.owner_id == user.id)
+            .one()
+        )
+    else:
+        total_calls, total_errors, total_success = (
+            db.query(
+                func.coalesce(func.sum(APIUsageRollup.calls), 0),
+                func.coalesce(func.sum(APIUsageRollup.errors), 0),
+                func.coalesce(func.sum(APIUsageRollup.successes), 0),
+            )
+            .join(APIKey, APIKey.id == APIUsageRollup.api_key_id)
+            .filter(APIKey.owner_id == user.id, *usage_range(start, end))
+            .one()
+        )
 
     return {
-        "total_calls": sum(x[0] for x in total_calls),
-        "total_errors": sum(x[0] for x in total_errors),
-        "total_success": sum(x[0] for x in total_success),
+        "total_calls": total_calls,
+        "total_errors": total_errors,
+        "total_success": total_success,
     }
 
 @router.get("/analytics/{key_id}")
-def get_api_analytics_individual(key_id: int, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    key = db.query(APIKey).filter(APIKey.id == key_id, APIKey.owner_id == user.id).first()
-    if not key:
+def get_api_analytics_individual(
+    key_id: int,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    if start is None and end is None:
+        row = (
+            db.query(APIKey.id, APIKey.name, APIKey.total_calls, APIKey.total_errors, APIKey.total_success)
+            .filter(APIKey.id == key_id, APIKey.owner_id == user.id)
+            .first()
+        )
+    else:
+        row = (
+            db.query(
+                APIKey.id,
+                APIKey.name,
+                func.coalesce(func.sum(APIUsageRollup.calls), 0),
+                func.coalesce(func.sum(APIUsageRollup.errors), 0),
+                func.coalesce(func.sum(APIUsageRollup.successes), 0),
+            )
+            .outerjoin(
+                APIUsageRollup,
+                and_(APIUsageRollup.api_key_id == APIKey.id, *usage_range(start, end)),
+            )
+            .filter(APIKey.id == key_id, APIKey.owner_id == user.id)
+            .group_by(APIKey.id, APIKey.name)
+            .first()
+        )
+    if not row:
         raise HTTPException(status_code=404, detail="API key not found")
-    
+
+    return {
+        "key_id": row[0],
+        "name": row[1],
+        "total_calls": row[2],
+        "total_errors": row[3],
+        "total_success": row[4],
+    }
+
+@router.get("/analytics/{key_id}/usage")
+def get_api_usage_timeseries(
+    key_id: int,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    if start is None:
+        start = datetime.now(timezone.utc) - timedelta(hours=1)
+
+    rows = (
+        db.query(
+            APIUsageRollup.bucket,
+            func.sum(APIUsageRollup.calls),
+            func.sum(APIUsageRollup.successes),
+            func.sum(APIUsageRollup.errors),
+            func.avg(APIUsageRollup.latency_p50_ms),
+            func.max(APIUsageRollup.latency_p95_ms),
+            func.max(APIUsageRollup.latency_p99_ms),
+            func.max(APIUsageRollup.latency_max_ms),
+        )
+        .join(APIKey, APIKey.id == APIUsageRollup.api_key_id)
+        .filter(APIKey.id == key_id, APIKey.owner_id == user.id, *usage_range(start, end))
+        .group_by(APIUsageRollup.bucket)
+        .order_by(APIUsageRollup.bucket)
+        .all()
+    )
+
     return {
-        "key_id": key.id,
-        "name": key.name,
-        "total_calls": key.total_calls,
-        "total_errors": key.total_errors,
-        "total_success": key.total_success,
+        "key_id": key_id,
+        "usage": [
+            {
+                "bucket": bucket,
+                "calls": calls,
+                "successes": successes,
+                "errors": errors,
+                "latency_p50_ms": p50,
+                "latency_p95_ms": p95,
+                "latency_p99_ms": p99,
+                "latency_max_ms": latency_max,
+            }
+            for bucket, calls, successes, errors, p50, p95, p99, latency_max in rows
+        ],
     }
@@ -1,25 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
 from typing import Optional
-from auth_deps import get_current_user
-from database import get_db
+from auth_deps import get_current_user, invalidate_principal
+from database import SessionLocal, get_db
+from hashing import hash_password, verify_password
 from models.user import User
-from models.token import BlacklistedToken
+from revocation import is_revoked, revocations, revoke
 from schemas import RefreshToken, UserCreate, UserLogin, Token
 import config as settings
 import uuid
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def get_password_hash(password: str):
-    return pwd_context.hash(password)
-
-def verify_password(plain_password: str, hashed_password: str):
-    return pwd_context.verify(plain_password, hashed_password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -39,25 +33,46 @@ def decode_token(token: str):
     except JWTError:
         return None
 
+def find_user_by_email(email: str):
+    with SessionLocal() as db:
+        return (
+            db.query(User.id, User.email, User.hashed_password, User.is_active)
+            .filter(User.email == email)
+            .first()
+        )
+
+def create_user(email: str, hashed_password: str):
+    with SessionLocal() as db:
+        db.add(User(email=email, hashed_password=hashed_password))
+        db.commit()
+
+def update_password_hash(user_id: int, hashed_password: str):
+    with SessionLocal() as db:
+        db.query(User).filter(User.id == user_id).update({User.hashed_password: hashed_password})
+        db.commit()
+
 @router.post("/sign_up", status_code=status.HTTP_200_OK)
-def sign_up(user: UserCreate, db: Session = Depends(get_db)):
-    existing = db.query(User).filter(User.email == user.email).first()
+async def sign_up(user: UserCreate):
+    existing = await run_in_threadpool(find_user_by_email, user.email)
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    hashed_pw = get_password_hash(user.password)
-    db_user = User(email=user.email, hashed_password=hashed_pw)
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    hashed_pw = await hash_password(user.password)
+    await run_in_threadpool(create_user, user.email, hashed_pw)
     return {"message": "User registered successfully"}
 
 @router.post("/sign_in")
-def sign_in(user: UserLogin, db: Session = Depends(get_db)):
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if not db_user or not verify_password(user.password, db_user.hashed_password):
+async def sign_in(user: UserLogin):
+    db_user = await run_in_threadpool(find_user_by_email, user.email)
+    if not db_user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
+    verified, new_hash = await verify_password(user.password, db_user.hashed_password)
+    if not verified:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    if new_hash is not None:
+        await run_in_threadpool(update_password_hash, db_user.id, new_hash)
+
     access_token = create_access_token({"sub": str(db_user.id)})
     refresh_token = create_access_token(
         {"sub": str(db_user.id)}, expires_delta=timedelta(days=7)
@@ -85,12 +100,7 @@ def refresh_token(refresh: RefreshToken, db: Session = Depends(get_db)):
     if not jti:
         raise HTTPException(status_code=401, detail="Missing jti in token")
 
-    token_blacklisted = (
-        db.query(BlacklistedToken)
-          .filter(BlacklistedToken.jti == jti)
-          .first()
-    )
-    if token_blacklisted:
+    if is_revoked(db, jti):
         raise HTTPException(status_code=401, detail="Refresh token blacklisted")
 
     user_id = payload.get("sub")
@@ -126,13 +136,18 @@ def sign_out(
     if not jti:
         raise HTTPException(status_code=401, detail="Missing jti in access token")
 
-    db.add(BlacklistedToken(jti=jti))
+    revoked = [payload]
 
     if refresh_token:
         refresh_payload = decode_token(refresh_token)
         if refresh_payload and refresh_payload.get("jti"):
-            db.add(BlacklistedToken(jti=refresh_payload["jti"]))
+            revoked.append(refresh_payload)
 
+    for token_payload in revoked:
+        revoke(db, token_payload)
     db.commit()
+    for token_payload in revoked:
+        revocations.add(token_payload["jti"])
+    invalidate_principal(current_user.id)
 
     return {"message": "Signed out successfully"}
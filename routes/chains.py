@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends
-from pytest import Session
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Response
 
 from auth_deps import get_current_user
-from database import get_db
+from chain_registry import ChainRegistry
 from models.user import User
+from responses import etag_matches
 
 router = APIRouter(prefix="/chains", tags=["Chains"])
 
@@ -325,6 +326,16 @@ chains = {
   }
 }
 
+chain_registry = ChainRegistry(chains)
+
+CHAINS_CACHE_CONTROL = "private, max-age=3600"
+
 @router.get("/")
-def get_chains(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return chains
+async def get_chains(
+    current_user: User = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
+):
+    headers = {"ETag": chain_registry.etag, "Cache-Control": CHAINS_CACHE_CONTROL}
+    if etag_matches(if_none_match, chain_registry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=chain_registry.body, media_type="application/json", headers=headers)
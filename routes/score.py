@@ -1,99 +1,47 @@
-import requests
+import asyncio
+import httpx
+import logging
+import time
 from datetime import datetime, timezone
-from collections import defaultdict
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Annotated
-from database import get_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from typing import Annotated, Optional
 from auth_deps import get_current_user
-from schemas import ScoreRequest
-from sqlalchemy.orm import Session
+from schemas import ScoreRequest, ScoreBatchRequest, MultiChainScoreRequest
 from models.user import User
-import config as settings
-import statistics
 from fastapi import Query
-from models.api_key import APIKey
-
-router = APIRouter(tags=["Score"], prefix="/score")
-
-GOLDRUSH_API_KEY = settings.COVALENT_API_KEY
-GOLDRUSH_BASE_URL = "https://api.covalenthq.com/v1"
-HEADERS = {"Authorization": f"Bearer {GOLDRUSH_API_KEY}"}
-
-def get_goldrush_transactions(address: str, chain: str, tx_limit: int):
-    url = f"{GOLDRUSH_BASE_URL}/allchains/transactions/"
-    params = {
-        "chains": chain,
-        "addresses": address,
-        "limit": tx_limit,
-        "no-logs": "true"
-    }
-    resp = requests.get(url, headers=HEADERS, params=params)
-    resp.raise_for_status()
-    data = resp.json().get("data", {})
-    return data.get("items", []) if data else []
-
-def get_goldrush_token_balances(address: str, chain: str):
-    url = f"{GOLDRUSH_BASE_URL}/{chain}/address/{address}/balances_v2/"
-    resp = requests.get(url, headers=HEADERS)
-    resp.raise_for_status()
-    data = resp.json().get("data", {})
-    return data.get("items", []) if data else []
-
-def analyze_tx_quality(txs):
-    if not txs:
-        return {
-            "frequency_per_month": {},
-            "frequency_per_year": {},
-            "failure_rate": 1.0,
-            "avg_tx_value_usd": 0.0,
-        }
+from api_key_cache import lookup_api_key, usage_counters
+from ratelimit import enforce_key_limit, enforce_upstream_budget, score_upstream_cost
+from goldrush import GoldRushError, iter_goldrush_transactions, get_goldrush_token_balances, get_goldrush_transactions_summary
+from tx_store import load_transactions
+from analysis import TxFeatureExtractor
+from scoring import CreditScoreCalculator, MODEL_VERSION, feature_matrix, feature_vector, score_batch
+from snapshots import get_latest_snapshot, is_fresh, save_snapshot, snapshot_age_seconds, snapshot_etag
+from singleflight import SingleFlight
+import config as settings
+import metrics
+from responses import ScoreJSONResponse, etag_matches, project_score
+from routes.chains import chain_registry
 
-    dates = [datetime.fromisoformat(tx["block_signed_at"]) for tx in txs if tx.get("block_signed_at")]
-    freq_month = defaultdict(int)
-    freq_year = defaultdict(int)
-    for d in dates:
-        freq_month[d.strftime("%Y-%m")] += 1
-        freq_year[d.year] += 1
+logger = logging.getLogger(__name__)
 
-    total_txs = len(txs)
-    failures = sum(1 for tx in txs if not tx.get("successful", True))
-    failure_rate = failures / total_txs if total_txs > 0 else 0
+router = APIRouter(tags=["Score"], prefix="/score")
 
-    total_value_usd = sum(tx.get("value_quote", 0) for tx in txs)
-    avg_value_usd = total_value_usd / total_txs if total_txs > 0 else 0
+score_flights = SingleFlight()
+metrics.register("score_single_flight", lambda: {"in_flight": score_flights.in_flight()})
 
+def empty_wallet_age() -> dict:
+    today_str = datetime.now().strftime("%d-%m-%Y")
     return {
-        "frequency_per_month": dict(freq_month),
-        "frequency_per_year": dict(freq_year),
-        "failure_rate": failure_rate,
-        "avg_tx_value_usd": avg_value_usd,
+        "wallet_age_days": 0,
+        "first_tx_date": today_str,
+        "last_tx_date": today_str
     }
 
-def analyze_diversification(txs, balances):
-    unique_to_addresses = {tx["to_address"].lower() for tx in txs if tx.get("to_address")}
-    unique_tokens = {token.get("contract_address") for token in balances if token.get("contract_address")}
-    return {
-        "unique_tokens_held": len(unique_tokens),
-        "unique_to_addresses": len(unique_to_addresses),
-    }
-
-def analyze_wallet_age_and_activity(chain_name, wallet_address):
-    url = f"https://api.covalenthq.com/v1/{chain_name}/address/{wallet_address}/transactions_summary/"
-    headers = {"Authorization": f"Bearer {GOLDRUSH_API_KEY}"}
-    response = requests.get(url, headers=headers)
-
-    if response.status_code != 200:
-        raise Exception(f"API request failed: {response.status_code} {response.text}")
-
-    data = response.json()
+async def fetch_wallet_activity(chain_name, wallet_address):
+    data = await get_goldrush_transactions_summary(chain_name, wallet_address)
 
     if not data.get("data") or not data["data"].get("items") or not data["data"]["items"][0].get("earliest_transaction"):
-        today_str = datetime.now().strftime("%d-%m-%Y")
-        return {
-            "wallet_age_days": 0,
-            "first_tx_date": today_str,
-            "last_tx_date": today_str
-        }
+        return None
 
     item = data["data"]["items"][0]
 
@@ -112,189 +60,290 @@ def analyze_wallet_age_and_activity(chain_name, wallet_address):
         "last_tx_date": last_tx_date.strftime("%d-%m-%Y"),
     }
 
-def analyze_gas_usage(txs):
-    gas_prices = [float(tx.get("gas_price", 0)) for tx in txs if tx.get("gas_price")]
-    if not gas_prices:
-        return {"avg_gas_price": 0, "median_gas_price": 0, "gas_price_ratio": 0}
-    
-    gas_prices.sort()
-    n = len(gas_prices)
-    avg_gas = statistics.mean(gas_prices)
-    median_gas = statistics.median(gas_prices)
-    gas_price_ratio = avg_gas / median_gas if median_gas > 0 else 0
-    
+async def analyze_wallet_age_and_activity(chain_name, wallet_address):
+    return await fetch_wallet_activity(chain_name, wallet_address) or empty_wallet_age()
+
+async def fetch_goldrush_data(address: str, chain_name: str, tx_limit: int, extractor: TxFeatureExtractor, keep_txs: bool = True):
+    return await asyncio.gather(
+        load_transactions(address, chain_name, tx_limit, extractor, keep_txs),
+        get_goldrush_token_balances(address, chain_name),
+        analyze_wallet_age_and_activity(chain_name, address),
+    )
+
+async def stream_multichain_transactions(address: str, chain_names: tuple, tx_limit: int, extractors: dict, combined: TxFeatureExtractor, keep_txs: bool = True):
+    txs = [] if keep_txs else None
+    async for page in iter_goldrush_transactions(address, ",".join(chain_names), tx_limit):
+        for tx in page:
+            combined.add(tx)
+            extractor = extractors.get(tx.get("chain_name"))
+            if extractor is not None:
+                extractor.add(tx)
+        if keep_txs:
+            txs.extend(page)
+    return txs
+
+def build_analyses(extractor: TxFeatureExtractor, balances, wallet_age: dict) -> dict:
+    features = extractor.result(balances)
     return {
-        "avg_gas_price": avg_gas,
-        "median_gas_price": median_gas,
-        "gas_price_ratio": gas_price_ratio,
+        "tx_quality": features["tx_quality"],
+        "diversification": features["diversification"],
+        "wallet_age": wallet_age,
+        "gas_usage": features["gas_usage"],
+        "total_balance": features["total_balance"],
+        "incoming_outgoing": features["incoming_outgoing"],
+        "inter_transaction_time": features["inter_transaction_time"],
     }
 
-def analyze_total_balance(balances):
-    total_balance_usd = sum(token.get("quote", 0.0) or 0.0 for token in balances)
-    return {"total_balance_usd": total_balance_usd}
+def merge_wallet_age(wallet_ages: list) -> dict:
+    # Chains without history have no dates to contribute.
+    wallet_ages = [age for age in wallet_ages if age is not None]
+    if not wallet_ages:
+        return empty_wallet_age()
+    oldest = max(wallet_ages, key=lambda age: age["wallet_age_days"])
+    last_tx_date = max(
+        (age["last_tx_date"] for age in wallet_ages),
+        key=lambda d: datetime.strptime(d, "%d-%m-%Y"),
+    )
+    return {
+        "wallet_age_days": oldest["wallet_age_days"],
+        "first_tx_date": oldest["first_tx_date"],
+        "last_tx_date": last_tx_date,
+    }
+
+def resolve_chain(chain: str) -> str:
+    resolved = chain_registry.resolve(chain)
+    if resolved is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported chain: {chain}")
+    return resolved.c_id
+
+def elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
+
+async def compute_score(address: str, chain_name: str, tx_limit: int, keep_txs: bool = True):
+    extractor = TxFeatureExtractor(address)
+    txs, balances, wallet_age = await fetch_goldrush_data(address, chain_name, tx_limit, extractor, keep_txs)
+
+    analyses = build_analyses(extractor, balances, wallet_age)
+
+    calc = CreditScoreCalculator(analyses)
+    score = calc.calculate_score()
+
+    await save_snapshot(address, chain_name, tx_limit, feature_vector(analyses), analyses, score)
 
-def analyze_incoming_outgoing(txs, address):
-    address = address.lower()
-    incoming_count, outgoing_count = 0, 0
-    incoming_value, outgoing_value = 0.0, 0.0
-
-    for tx in txs:
-        value = tx.get("value_quote", 0.0)
-        if tx.get("to_address", "").lower() == address:
-            incoming_count += 1
-            incoming_value += value
-        if tx.get("from_address", "").lower() == address:
-            outgoing_count += 1
-            outgoing_value += value
-            
     return {
-        "incoming_count": incoming_count,
-        "outgoing_count": outgoing_count,
-        "incoming_value_usd": incoming_value,
-        "outgoing_value_usd": outgoing_value,
-        "io_count_ratio": (incoming_count / outgoing_count) if outgoing_count > 0 else None,
-        "io_value_ratio": (incoming_value / outgoing_value) if outgoing_value > 0 else None,
+        "credit_score": score,
+        "details": analyses,
+        "txs": txs
     }
 
-def analyze_inter_tx_time(txs):
-    if len(txs) < 2:
-        return {"avg_inter_tx_seconds": None, "std_inter_tx_seconds": None}
+async def compute_multichain_score(address: str, chain_names: tuple, tx_limit: int, keep_txs: bool = True):
+    extractors = {chain: TxFeatureExtractor(address) for chain in chain_names}
+    combined_extractor = TxFeatureExtractor(address)
+    txs, balances_by_chain, wallet_ages = await asyncio.gather(
+        stream_multichain_transactions(address, chain_names, tx_limit, extractors, combined_extractor, keep_txs),
+        asyncio.gather(*(get_goldrush_token_balances(address, chain) for chain in chain_names)),
+        asyncio.gather(*(fetch_wallet_activity(chain, address) for chain in chain_names)),
+    )
+
+    per_chain = {
+        chain: build_analyses(extractors[chain], balances, wallet_age or empty_wallet_age())
+        for chain, balances, wallet_age in zip(chain_names, balances_by_chain, wallet_ages)
+    }
+    all_balances = [token for balances in balances_by_chain for token in balances]
+    combined = build_analyses(combined_extractor, all_balances, merge_wallet_age(wallet_ages))
 
-    dates = sorted([datetime.fromisoformat(tx["block_signed_at"]) for tx in txs if tx.get("block_signed_at")])
-    if len(dates) < 2:
-        return {"avg_inter_tx_seconds": None, "std_inter_tx_seconds": None}
+    scores = score_batch(feature_matrix([*per_chain.values(), combined]))
 
-    diffs_seconds = [(dates[i+1] - dates[i]).total_seconds() for i in range(len(dates)-1)]
-    
     return {
-        "avg_inter_tx_seconds": statistics.mean(diffs_seconds),
-        "std_inter_tx_seconds": statistics.stdev(diffs_seconds) if len(diffs_seconds) > 1 else 0,
+        "credit_score": int(scores[-1]),
+        "details": combined,
+        "chains": {
+            chain: {"credit_score": int(score), "details": analyses}
+            for (chain, analyses), score in zip(per_chain.items(), scores)
+        },
+        "txs": txs
     }
 
-class CreditScoreCalculator:
-    def __init__(self, analyses: dict):
-        self.analyses = analyses
-
-    def score_metric(self, value, min_val, avg_val, max_val, max_score):
-        if value is None or value <= min_val: return 0
-        if value >= max_val: return max_score
-        half_score = max_score / 2
-        if value <= avg_val:
-            denom = avg_val - min_val
-            return ((value - min_val) / denom) * half_score if denom != 0 else half_score
-        else:
-            denom = max_val - avg_val
-            return half_score + ((value - avg_val) / denom) * half_score if denom != 0 else max_score
-
-    def calculate_score(self):
-        a = self.analyses
-        max_scores = {
-            "balance": 35,
-            "tx_frequency": 20,
-            "tx_value": 20,
-            "failure_penalty": 10,
-            "diversification_tokens": 10,
-            "diversification_addresses": 5,
-            "wallet_age": 15,
-            "gas_efficiency": 10,
-        }
-        max_raw_score = sum(max_scores.values())
-
-        balance_score = self.score_metric(a["total_balance"]["total_balance_usd"], 0, 1000, 25000, max_scores["balance"])
-        tx_frequency_score = self.score_metric(sum(a["tx_quality"]["frequency_per_year"].values()), 0, 50, 300, max_scores["tx_frequency"])
-        tx_value_score = self.score_metric(a["tx_quality"]["avg_tx_value_usd"], 0, 100, 2000, max_scores["tx_value"])
-        failure_penalty = (1 - a["tx_quality"]["failure_rate"]) * max_scores["failure_penalty"]
-        diversification_tokens_score = self.score_metric(a["diversification"]["unique_tokens_held"], 0, 5, 20, max_scores["diversification_tokens"])
-        diversification_addresses_score = self.score_metric(a["diversification"]["unique_to_addresses"], 0, 10, 50, max_scores["diversification_addresses"])
-        wallet_age_score = self.score_metric(a["wallet_age"]["wallet_age_days"], 0, 180, 1095, max_scores["wallet_age"])
-        gas_efficiency_score = max(0, max_scores["gas_efficiency"] * (2 - a["gas_usage"]["gas_price_ratio"]))
-
-        raw_total = (
-            balance_score + tx_frequency_score + tx_value_score +
-            failure_penalty + diversification_tokens_score + diversification_addresses_score +
-            wallet_age_score + gas_efficiency_score
-        )
-
-        final_score = (raw_total / max_raw_score) * 1.15 * 900 if max_raw_score > 0 else 0
-        return round(max(0, min(final_score, 900)))
-
-@router.post("/", tags=["Score"])
-def score_endpoint(
+async def get_score(address: str, chain_name: str, tx_limit: int, keep_txs: bool = True):
+    return await score_flights.do(
+        (chain_name, address, tx_limit, keep_txs),
+        lambda: compute_score(address, chain_name, tx_limit, keep_txs),
+    )
+
+async def get_multichain_score(address: str, chain_names: tuple, tx_limit: int, keep_txs: bool = True):
+    return await score_flights.do(
+        (chain_names, address, tx_limit, keep_txs),
+        lambda: compute_multichain_score(address, chain_names, tx_limit, keep_txs),
+    )
+
+@router.post("/", tags=["Score"], response_class=ScoreJSONResponse)
+async def score_endpoint(
     req: ScoreRequest,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Session = Depends(get_db),
 ):
-    chain_name = req.chain.lower()
+    chain_name = resolve_chain(req.chain)
     address = req.address.lower()
     tx_limit = req.tx_limit or 100
 
+    await enforce_upstream_budget(score_upstream_cost(tx_limit))
     try:
-        txs = get_goldrush_transactions(address, chain_name, tx_limit)
-        balances = get_goldrush_token_balances(address, chain_name)
-    except requests.HTTPError as e:
+        result = await get_score(address, chain_name, tx_limit, req.include_txs)
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=503, detail=f"External API Error: {str(e)}")
 
-    analyses = {
-        "tx_quality": analyze_tx_quality(txs),
-        "diversification": analyze_diversification(txs, balances),
-        "wallet_age": analyze_wallet_age_and_activity(chain_name, address),
-        "gas_usage": analyze_gas_usage(txs),
-        "total_balance": analyze_total_balance(balances),
-        "incoming_outgoing": analyze_incoming_outgoing(txs, address),
-        "inter_transaction_time": analyze_inter_tx_time(txs),
-    }
+    return ScoreJSONResponse(project_score(result, req.include_txs, req.fields))
 
-    calc = CreditScoreCalculator(analyses)
-    score = calc.calculate_score()
+@router.post("/multichain", tags=["Score"], response_class=ScoreJSONResponse)
+async def multichain_score_endpoint(
+    req: MultiChainScoreRequest,
+    current_user: Annotated[User, Depends(get_current_user)],
+):
+    chain_names = tuple(dict.fromkeys(resolve_chain(chain) for chain in req.chains))
+    address = req.address.lower()
+    tx_limit = req.tx_limit or 100
 
-    return {
-        "credit_score": score,
-        "details": analyses,
-        "txs": txs
-    }
+    await enforce_upstream_budget(score_upstream_cost(tx_limit, len(chain_names)))
+    try:
+        result = await get_multichain_score(address, chain_names, tx_limit, req.include_txs)
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=503, detail=f"External API Error: {str(e)}")
+
+    return ScoreJSONResponse(project_score(result, req.include_txs, req.fields))
+
+@router.get("/snapshot", tags=["Score"], response_class=ScoreJSONResponse)
+async def get_score_snapshot(
+    address: str,
+    chain: str,
+    current_user: Annotated[User, Depends(get_current_user)],
+    tx_limit: int = Query(100, ge=1, le=settings.SCORE_MAX_TX_LIMIT),
+    if_none_match: Optional[str] = Header(None),
+):
+    chain_name = resolve_chain(chain)
+    address = address.lower()
+
+    snapshot = await get_latest_snapshot(address, chain_name, tx_limit)
+    if snapshot is not None and is_fresh(snapshot):
+        features = snapshot.features
+        max_age = int(settings.SCORE_SNAPSHOT_TTL - snapshot_age_seconds(snapshot))
+        body = {
+            "credit_score": snapshot.score,
+            "details": snapshot.details,
+            "model_version": snapshot.model_version,
+            "computed_at": snapshot.computed_at.isoformat(),
+        }
+    else:
+        await enforce_upstream_budget(score_upstream_cost(tx_limit))
+        try:
+            result = await get_score(address, chain_name, tx_limit, keep_txs=False)
+        except httpx.HTTPError as e:
+            raise HTTPException(status_code=503, detail=f"External API Error: {str(e)}")
+
+        features = feature_vector(result["details"])
+        max_age = settings.SCORE_SNAPSHOT_TTL
+        body = {
+            "credit_score": result["credit_score"],
+            "details": result["details"],
+            "model_version": MODEL_VERSION,
+            "computed_at": datetime.now(timezone.utc).isoformat(),
+        }
 
-@router.post("/by_key", tags=["Score"])
-def score_with_api_key(
+    etag = snapshot_etag(MODEL_VERSION, features)
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={max(max_age, 0)}"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return ScoreJSONResponse(body, headers=headers)
+
+@router.post("/by_key", tags=["Score"], response_class=ScoreJSONResponse)
+async def score_with_api_key(
     req: ScoreRequest,
     api_key: str = Query(..., description="Your API key"),
-    db: Session = Depends(get_db),
 ):
-    key_obj = db.query(APIKey).filter(APIKey.key == api_key).first()
+    key_obj = await lookup_api_key(api_key)
     if not key_obj:
         raise HTTPException(status_code=401, detail="Invalid API key")
 
-    key_obj.total_calls += 1
-    try:
-        chain_name = req.chain.lower()
-        address = req.address.lower()
-        tx_limit = req.tx_limit or 100
+    chain_name = resolve_chain(req.chain)
+    address = req.address.lower()
+    tx_limit = req.tx_limit or 100
 
-        txs = get_goldrush_transactions(address, chain_name, tx_limit)
-        balances = get_goldrush_token_balances(address, chain_name)
+    await enforce_key_limit(key_obj)
+    await enforce_upstream_budget(score_upstream_cost(tx_limit))
 
-    except requests.HTTPError as e:
-        key_obj.total_errors += 1
-        db.commit()
+    started = time.perf_counter()
+    try:
+        result = await get_score(address, chain_name, tx_limit, req.include_txs)
+
+    except httpx.HTTPError as e:
+        usage_counters.record(key_obj.id, calls=1, errors=1, latency_ms=elapsed_ms(started))
         raise HTTPException(status_code=503, detail=f"External API Error: {str(e)}")
 
-    analyses = {
-        "tx_quality": analyze_tx_quality(txs),
-        "diversification": analyze_diversification(txs, balances),
-        "wallet_age": analyze_wallet_age_and_activity(chain_name, address),
-        "gas_usage": analyze_gas_usage(txs),
-        "total_balance": analyze_total_balance(balances),
-        "incoming_outgoing": analyze_incoming_outgoing(txs, address),
-        "inter_transaction_time": analyze_inter_tx_time(txs),
-    }
+    usage_counters.record(key_obj.id, calls=1, success=1, latency_ms=elapsed_ms(started))
 
-    calc = CreditScoreCalculator(analyses)
-    score = calc.calculate_score()
+    return ScoreJSONResponse(project_score(result, req.include_txs, req.fields))
 
-    key_obj.total_success += 1
-    db.commit()
+@router.post("/batch", tags=["Score"], response_class=ScoreJSONResponse)
+async def score_batch_with_api_key(
+    req: ScoreBatchRequest,
+    api_key: str = Query(..., description="Your API key"),
+):
+    key_obj = await lookup_api_key(api_key)
+    if not key_obj:
+        raise HTTPException(status_code=401, detail="Invalid API key")
 
-    return {
-        "credit_score": score,
-        "details": analyses,
-        "txs": txs
-    }
\ No newline at end of file
+    chains = [chain_registry.resolve(item.chain) for item in req.items]
+
+    await enforce_key_limit(key_obj, len(req.items))
+
+    started = time.perf_counter()
+    semaphore = asyncio.Semaphore(settings.SCORE_BATCH_CONCURRENCY)
+
+    async def score_item(item: ScoreRequest, chain):
+        if chain is None:
+            raise HTTPException(status_code=400, detail=f"Unsupported chain: {item.chain}")
+        tx_limit = item.tx_limit or 100
+        async with semaphore:
+            # Charged as each item starts so one large batch cannot drain the
+            # shared budget ahead of other tenants.
+            await enforce_upstream_budget(score_upstream_cost(tx_limit))
+            return await get_score(item.address.lower(), chain.c_id, tx_limit, keep_txs=False)
+
+    outcomes = await asyncio.gather(
+        *(score_item(item, chain) for item, chain in zip(req.items, chains)), return_exceptions=True
+    )
+
+    results = []
+    errors = 0
+    for item, outcome in zip(req.items, outcomes):
+        if isinstance(outcome, httpx.HTTPError):
+            errors += 1
+            results.append({"address": item.address, "chain": item.chain, "error": f"External API Error: {str(outcome)}"})
+        elif isinstance(outcome, HTTPException):
+            errors += 1
+            results.append({"address": item.address, "chain": item.chain, "error": outcome.detail})
+        elif isinstance(outcome, GoldRushError):
+            errors += 1
+            results.append({"address": item.address, "chain": item.chain, "error": str(outcome)})
+        elif isinstance(outcome, Exception):
+            # Database and other internal errors are logged, not sent to the partner.
+            errors += 1
+            logger.error("Batch scoring failed for %s on %s", item.address, item.chain, exc_info=outcome)
+            results.append({"address": item.address, "chain": item.chain, "error": "Internal error while scoring this wallet"})
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results.append({
+                "address": item.address,
+                "chain": item.chain,
+                "credit_score": outcome["credit_score"],
+                "details": outcome["details"],
+            })
+
+    usage_counters.record(
+        key_obj.id,
+        calls=len(req.items),
+        success=len(req.items) - errors,
+        errors=errors,
+        latency_ms=elapsed_ms(started),
+    )
+
+    return ScoreJSONResponse({"results": results})
@@ -1,39 +1,86 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import csv
+import io
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
+from sqlalchemy import or_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
-from database import get_db
+from starlette.concurrency import run_in_threadpool
+from database import SessionLocal, get_db
 from models.wallet import Wallet
-from schemas import WalletCreate, WalletOut
+from routes.chains import chain_registry
+from schemas import WalletCreate, WalletImportRow, WalletOut
 from auth_deps import get_current_user
 from models.user import User
-from utils import is_valid_address, can_fetch_data_from_goldrush
+from ratelimit import enforce_upstream_budget
+from utils import is_valid_address, is_verification_cached, can_fetch_data_from_goldrush
 from random_name import generate_name
+import config as settings
 
 router = APIRouter(prefix="/wallets", tags=["Wallets"])
 
+VIEW_TOUCH_INTERVAL = timedelta(minutes=5)
+
 @router.get("/", response_model=list[WalletOut])
 def get_wallets(
-    chain: str, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+    chain: str,
+    cursor: Optional[int] = Query(None, description="Return wallets with an id greater than this"),
+    limit: int = Query(settings.WALLETS_PAGE_SIZE, ge=1, le=settings.WALLETS_PAGE_MAX),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
 ):
-    return db.query(Wallet).filter(Wallet.user_id == current_user.id, Wallet.chain == chain).all()
+    query = db.query(Wallet.id, Wallet.address, Wallet.chain, Wallet.nickname).filter(
+        Wallet.user_id == current_user.id, Wallet.chain == chain
+    )
+    if cursor is not None:
+        query = query.filter(Wallet.id > cursor)
+    rows = query.order_by(Wallet.id).limit(limit + 1).all()
+
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = str(rows[-1].id)
+
+    if rows:
+        now = datetime.now(timezone.utc)
+        db.query(Wallet).filter(
+            Wallet.id.in_([row.id for row in rows]),
+            or_(Wallet.last_viewed_at.is_(None), Wallet.last_viewed_at < now - VIEW_TOUCH_INTERVAL),
+        ).update({Wallet.last_viewed_at: now}, synchronize_session=False)
+        db.commit()
+
+    return ORJSONResponse([row._asdict() for row in rows], headers=headers)
 
 @router.post("/verify")
-def verify_wallet(wallet: WalletCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def verify_wallet(wallet: WalletCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     # if not is_valid_address(wallet.address):
     #     return {"message": "Invalid wallet address format.", "error": True}
 
-    if not can_fetch_data_from_goldrush(wallet.address, wallet.chain):
+    if not await can_fetch_data_from_goldrush(wallet.address, wallet.chain):
         return {"message": "Wallet address could not be verified on the specified chain.",  "error": True}
 
     return {"message": "Wallet address and chain are valid and verified via goldrush.",  "error": False}
 
 
+def create_wallet(values: dict) -> Wallet:
+    with SessionLocal() as db:
+        db_wallet = Wallet(**values)
+        db.add(db_wallet)
+        db.commit()
+        db.refresh(db_wallet)
+        return db_wallet
+
 @router.post("/", response_model=WalletOut)
-def add_wallet(
+async def add_wallet(
     wallet: WalletCreate,
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    if not can_fetch_data_from_goldrush(wallet.address, wallet.chain):
+    if not await can_fetch_data_from_goldrush(wallet.address, wallet.chain):
         return {"message": "Wallet address could not be verified on the specified chain.",  "error": True}
     
     if str(wallet.nickname).strip() != "":
@@ -41,13 +88,133 @@ def add_wallet(
     else:
         nickname = generate_name()
 
-    db_wallet = Wallet(
-        address=wallet.address, chain=wallet.chain, user_id=current_user.id, nickname=nickname
+    return await run_in_threadpool(create_wallet, {
+        "address": wallet.address, "chain": wallet.chain, "user_id": current_user.id, "nickname": nickname,
+    })
+
+def import_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413, detail=f"Imports are limited to {settings.WALLET_IMPORT_MAX_BYTES} bytes"
     )
-    db.add(db_wallet)
-    db.commit()
-    db.refresh(db_wallet)
-    return db_wallet
+
+async def read_import_body(request: Request) -> bytes:
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > settings.WALLET_IMPORT_MAX_BYTES:
+        raise import_too_large()
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > settings.WALLET_IMPORT_MAX_BYTES:
+            raise import_too_large()
+    # Cached the way Request.body() does, so form() parses the bounded bytes.
+    request._body = bytes(body)
+    return request._body
+
+async def read_import_rows(request: Request) -> list:
+    content_type = request.headers.get("content-type", "")
+    if not content_type.startswith(("application/json", "multipart/form-data", "text/csv", "text/plain")):
+        raise HTTPException(status_code=415, detail="Send JSON, text/csv or a multipart CSV file")
+
+    body = await read_import_body(request)
+    if content_type.startswith("application/json"):
+        try:
+            payload = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            raise HTTPException(status_code=400, detail="Invalid JSON body")
+        return payload.get("wallets", []) if isinstance(payload, dict) else payload
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None:
+            raise HTTPException(status_code=400, detail="Missing 'file' field")
+        text = (await upload.read()).decode("utf-8-sig")
+    else:
+        text = body.decode("utf-8-sig")
+    return list(csv.DictReader(io.StringIO(text)))
+
+def insert_wallets(rows: list) -> dict:
+    if not rows:
+        return {}
+    with SessionLocal() as db:
+        inserted = db.execute(
+            insert(Wallet)
+            .on_conflict_do_nothing(index_elements=[Wallet.address])
+            .returning(Wallet.id, Wallet.address),
+            rows,
+        ).all()
+        db.commit()
+    return {address: wallet_id for wallet_id, address in inserted}
+
+@router.post("/import")
+async def import_wallets(request: Request, current_user: User = Depends(get_current_user)):
+    raw_rows = await read_import_rows(request)
+    if not isinstance(raw_rows, list):
+        raise HTTPException(status_code=400, detail="Expected a list of wallets")
+    if len(raw_rows) > settings.WALLET_IMPORT_MAX_ROWS:
+        raise HTTPException(
+            status_code=413, detail=f"At most {settings.WALLET_IMPORT_MAX_ROWS} wallets per import"
+        )
+
+    results = []
+    candidates = []
+    seen = set()
+    for index, raw in enumerate(raw_rows):
+        try:
+            row = WalletImportRow.model_validate(raw)
+        except ValidationError as e:
+            results.append({"row": index, "status": "invalid", "error": str(e.errors()[0]["msg"])})
+            continue
+
+        address = row.address.strip()
+        chain = chain_registry.resolve(row.chain)
+        result = {"row": index, "address": address, "chain": row.chain}
+        results.append(result)
+        if not address or chain is None:
+            result.update(status="invalid", error="Missing address or unsupported chain")
+        elif address.lower() in seen:
+            result.update(status="duplicate", error="Address appears earlier in this import")
+        else:
+            seen.add(address.lower())
+            nickname = (row.nickname or "").strip() or generate_name()
+            candidates.append((result, {
+                "address": address, "chain": chain.c_id, "user_id": current_user.id, "nickname": nickname,
+            }))
+
+    semaphore = asyncio.Semaphore(settings.WALLET_IMPORT_CONCURRENCY)
+
+    async def verify(wallet: dict):
+        async with semaphore:
+            # A wallet missing from the verification cache costs one GoldRush
+            # call, charged as it starts so a large import cannot drain the
+            # shared budget in one go.
+            if not is_verification_cached(wallet["address"], wallet["chain"]):
+                try:
+                    await enforce_upstream_budget(1)
+                except HTTPException as e:
+                    return e
+            return await can_fetch_data_from_goldrush(wallet["address"], wallet["chain"])
+
+    verified = await asyncio.gather(*(verify(wallet) for _, wallet in candidates))
+
+    to_insert = []
+    for (result, wallet), ok in zip(candidates, verified):
+        if isinstance(ok, HTTPException):
+            result.update(status="rate_limited", error=ok.detail)
+        elif ok:
+            to_insert.append((result, wallet))
+        else:
+            result.update(status="unverified", error="Wallet address could not be verified on the specified chain.")
+
+    inserted = await run_in_threadpool(insert_wallets, [wallet for _, wallet in to_insert])
+    for result, wallet in to_insert:
+        wallet_id = inserted.get(wallet["address"])
+        if wallet_id is None:
+            result.update(status="duplicate", error="Wallet is already registered")
+        else:
+            result.update(status="imported", id=wallet_id, nickname=wallet["nickname"])
+
+    return {"imported": len(inserted), "results": results}
 
 @router.delete("/{wallet_id}")
 def delete_wallet(
@@ -0,0 +1,158 @@
+import asyncio
+import itertools
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException
+from sqlalchemy import and_, case, exists, func
+from starlette.concurrency import run_in_threadpool
+from database import SessionLocal
+from models.wallet import Wallet
+from models.score_snapshot import ScoreSnapshot
+from ratelimit import enforce_upstream_budget, score_upstream_cost
+from routes.chains import chain_registry
+from scoring import MODEL_VERSION
+import config as settings
+import metrics
+
+logger = logging.getLogger(__name__)
+
+class RateLimiter:
+    def __init__(self, rate_per_second: float):
+        self.interval = 1 / rate_per_second if rate_per_second > 0 else 0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+def load_wallets_due(limit: int) -> list:
+    rescore_before = datetime.now(timezone.utc) - timedelta(seconds=settings.SCHEDULER_RESCORE_AFTER)
+    # Wallets may store a friendly chain name; snapshots are keyed by c_id.
+    wallet_chain = func.lower(Wallet.chain)
+    wallet_c_id = case(
+        {name: chain.c_id for name, chain in chain_registry.by_name.items()},
+        value=wallet_chain,
+        else_=wallet_chain,
+    )
+    supported = wallet_chain.in_([*chain_registry.by_name, *chain_registry.by_c_id])
+    fresh_snapshot = exists().where(and_(
+        ScoreSnapshot.chain == wallet_c_id,
+        ScoreSnapshot.address == func.lower(Wallet.address),
+        ScoreSnapshot.tx_limit == settings.SCHEDULER_TX_LIMIT,
+        ScoreSnapshot.model_version == MODEL_VERSION,
+        ScoreSnapshot.computed_at > rescore_before,
+    ))
+
+    with SessionLocal() as db:
+        return (
+            db.query(Wallet.chain, Wallet.address, Wallet.last_viewed_at)
+            .filter(supported, ~fresh_snapshot)
+            .order_by(Wallet.last_viewed_at.desc().nullslast())
+            .limit(limit)
+            .all()
+        )
+
+class PrescoreScheduler:
+    def __init__(self, score_fn):
+        self.score_fn = score_fn
+        self.queue = asyncio.PriorityQueue()
+        self.limiter = RateLimiter(settings.SCHEDULER_RATE_PER_SECOND)
+        self._queued = set()
+        self._backoff = {}
+        self._sequence = itertools.count()
+        self._tasks = []
+
+        self.scored = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def start(self):
+        self._tasks.append(asyncio.create_task(self._refill_loop()))
+        for _ in range(settings.SCHEDULER_WORKERS):
+            self._tasks.append(asyncio.create_task(self._worker()))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def enqueue(self, chain: str, address: str, last_viewed_at: datetime = None):
+        resolved = chain_registry.resolve(chain)
+        if resolved is None:
+            self.skipped += 1
+            return
+        key = (resolved.c_id, address.lower())
+        if key in self._queued:
+            return
+        backoff = self._backoff.get(key)
+        if backoff is not None and backoff[1] > time.monotonic():
+            return
+        # Most recently viewed first; never-viewed wallets go to the back.
+        priority = -last_viewed_at.timestamp() if last_viewed_at else 0.0
+        self._queued.add(key)
+        self.queue.put_nowait((priority, next(self._sequence), key))
+
+    async def _refill_loop(self):
+        while True:
+            try:
+                wallets = await run_in_threadpool(load_wallets_due, settings.SCHEDULER_BATCH_SIZE)
+                for chain, address, last_viewed_at in wallets:
+                    self.enqueue(chain, address, last_viewed_at)
+            except Exception:
+                logger.exception("Failed to load wallets for pre-scoring")
+            await asyncio.sleep(settings.SCHEDULER_INTERVAL)
+
+    async def _worker(self):
+        while True:
+            _, _, key = await self.queue.get()
+            chain, address = key
+            try:
+                await self.limiter.acquire()
+                await self._wait_for_upstream_budget()
+                await self.score_fn(address, chain, settings.SCHEDULER_TX_LIMIT, keep_txs=False)
+                self.scored += 1
+                self._backoff.pop(key, None)
+            except Exception:
+                self.failed += 1
+                self._record_failure(key)
+                logger.exception("Pre-scoring failed for %s on %s", address, chain)
+            finally:
+                self._queued.discard(key)
+                self.queue.task_done()
+
+    async def _wait_for_upstream_budget(self):
+        while True:
+            try:
+                await enforce_upstream_budget(score_upstream_cost(settings.SCHEDULER_TX_LIMIT))
+                return
+            except HTTPException as e:
+                # Without Retry-After the cost exceeds the burst and waiting won't help.
+                if not e.headers:
+                    raise
+                await asyncio.sleep(float(e.headers["Retry-After"]))
+
+    def _record_failure(self, key: tuple):
+        failures = self._backoff.get(key, (0, 0.0))[0] + 1
+        delay = min(settings.SCHEDULER_RETRY_BASE * 2 ** (failures - 1), settings.SCHEDULER_RETRY_MAX)
+        self._backoff[key] = (failures, time.monotonic() + delay)
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.queue.qsize(),
+            "scored": self.scored,
+            "failed": self.failed,
+            "skipped_unsupported_chain": self.skipped,
+            "backing_off": len(self._backoff),
+        }
+
+def create_scheduler(score_fn) -> PrescoreScheduler:
+    scheduler = PrescoreScheduler(score_fn)
+    metrics.register("prescore_scheduler", scheduler.stats)
+    return scheduler
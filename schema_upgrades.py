@@ -0,0 +1,23 @@
+from sqlalchemy import text
+
+# create_all only creates missing tables. Changes to tables that already
+# exist are listed here; every statement must be safe to run repeatedly.
+UPGRADES = [
+    # Pre-scoring orders wallets by when they were last viewed.
+    "ALTER TABLE wallets ADD COLUMN IF NOT EXISTS last_viewed_at TIMESTAMPTZ",
+    # Keyset pagination of a user's wallets on a chain.
+    "CREATE INDEX IF NOT EXISTS ix_wallets_user_id_chain_id ON wallets (user_id, chain, id)",
+    # Per-key rate limit overrides.
+    "ALTER TABLE api_keys ADD COLUMN IF NOT EXISTS rate_limit_per_second DOUBLE PRECISION",
+    "ALTER TABLE api_keys ADD COLUMN IF NOT EXISTS rate_limit_burst INTEGER",
+    # Revoked tokens carry their expiry so they can be purged.
+    "ALTER TABLE blacklisted_tokens ADD COLUMN IF NOT EXISTS expires_at TIMESTAMPTZ",
+    "CREATE INDEX IF NOT EXISTS ix_blacklisted_tokens_expires_at ON blacklisted_tokens (expires_at)",
+]
+
+def apply_upgrades(engine):
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as connection:
+        for statement in UPGRADES:
+            connection.execute(text(statement))
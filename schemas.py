@@ -1,5 +1,6 @@
 from typing import Optional, List
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
+import config as settings
 
 class UserBase(BaseModel):
     email: EmailStr
@@ -37,6 +38,11 @@ class WalletBase(BaseModel):
 class WalletCreate(WalletBase):
     pass
 
+class WalletImportRow(BaseModel):
+    address: str
+    chain: str
+    nickname: Optional[str] = None
+
 class WalletOut(WalletBase):
     id: int
     address: str
@@ -51,10 +57,22 @@ class ChainResponse(BaseModel):
     chain_id: str
     rpc_url: str
 
-class ScoreRequest(BaseModel):
+class ScoreProjection(BaseModel):
+    include_txs: bool = True
+    fields: Optional[List[str]] = None
+
+class ScoreRequest(ScoreProjection):
     address: str
     chain: str
-    tx_limit: int
+    tx_limit: int = Field(..., ge=0, le=settings.SCORE_MAX_TX_LIMIT)
+
+class ScoreBatchRequest(BaseModel):
+    items: List[ScoreRequest] = Field(..., min_length=1, max_length=settings.SCORE_BATCH_MAX_ITEMS)
+
+class MultiChainScoreRequest(ScoreProjection):
+    address: str
+    chains: List[str] = Field(..., min_length=1, max_length=settings.SCORE_MULTICHAIN_MAX_CHAINS)
+    tx_limit: int = Field(..., ge=0, le=settings.SCORE_MAX_TX_LIMIT)
 
 class ScoreResponse(BaseModel):
     score: int
@@ -0,0 +1,87 @@
+import numpy as np
+
+MODEL_VERSION = "1"
+
+MAX_SCORES = {
+    "balance": 35,
+    "tx_frequency": 20,
+    "tx_value": 20,
+    "failure_penalty": 10,
+    "diversification_tokens": 10,
+    "diversification_addresses": 5,
+    "wallet_age": 15,
+    "gas_efficiency": 10,
+}
+MAX_RAW_SCORE = sum(MAX_SCORES.values())
+
+FEATURES = (
+    "total_balance_usd",
+    "tx_count",
+    "avg_tx_value_usd",
+    "failure_rate",
+    "unique_tokens_held",
+    "unique_to_addresses",
+    "wallet_age_days",
+    "gas_price_ratio",
+)
+
+def feature_vector(analyses: dict) -> list:
+    a = analyses
+    return [
+        a["total_balance"]["total_balance_usd"],
+        sum(a["tx_quality"]["frequency_per_year"].values()),
+        a["tx_quality"]["avg_tx_value_usd"],
+        a["tx_quality"]["failure_rate"],
+        a["diversification"]["unique_tokens_held"],
+        a["diversification"]["unique_to_addresses"],
+        a["wallet_age"]["wallet_age_days"],
+        a["gas_usage"]["gas_price_ratio"],
+    ]
+
+def feature_matrix(analyses_list) -> np.ndarray:
+    return np.array([feature_vector(a) for a in analyses_list], dtype=np.float64).reshape(-1, len(FEATURES))
+
+def score_metric_batch(values, min_val, avg_val, max_val, max_score) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64)
+    half_score = max_score / 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = avg_val - min_val
+        lower = ((values - min_val) / denom) * half_score if denom != 0 else np.full_like(values, half_score)
+        denom = max_val - avg_val
+        upper = half_score + ((values - avg_val) / denom) * half_score if denom != 0 else np.full_like(values, max_score)
+
+    scores = np.where(values <= avg_val, lower, upper)
+    scores = np.where(values >= max_val, max_score, scores)
+    return np.where(np.isnan(values) | (values <= min_val), 0.0, scores)
+
+def score_batch(features) -> np.ndarray:
+    f = np.asarray(features, dtype=np.float64).reshape(-1, len(FEATURES))
+
+    balance_score = score_metric_batch(f[:, 0], 0, 1000, 25000, MAX_SCORES["balance"])
+    tx_frequency_score = score_metric_batch(f[:, 1], 0, 50, 300, MAX_SCORES["tx_frequency"])
+    tx_value_score = score_metric_batch(f[:, 2], 0, 100, 2000, MAX_SCORES["tx_value"])
+    failure_penalty = (1 - f[:, 3]) * MAX_SCORES["failure_penalty"]
+    diversification_tokens_score = score_metric_batch(f[:, 4], 0, 5, 20, MAX_SCORES["diversification_tokens"])
+    diversification_addresses_score = score_metric_batch(f[:, 5], 0, 10, 50, MAX_SCORES["diversification_addresses"])
+    wallet_age_score = score_metric_batch(f[:, 6], 0, 180, 1095, MAX_SCORES["wallet_age"])
+    gas_efficiency_score = np.maximum(0, MAX_SCORES["gas_efficiency"] * (2 - f[:, 7]))
+
+    raw_total = (
+        balance_score + tx_frequency_score + tx_value_score +
+        failure_penalty + diversification_tokens_score + diversification_addresses_score +
+        wallet_age_score + gas_efficiency_score
+    )
+
+    final_score = (raw_total / MAX_RAW_SCORE) * 1.15 * 900
+    return np.rint(np.clip(final_score, 0, 900)).astype(np.int64)
+
+class CreditScoreCalculator:
+    def __init__(self, analyses: dict):
+        self.analyses = analyses
+
+    def score_metric(self, value, min_val, avg_val, max_val, max_score):
+        return float(score_metric_batch([np.nan if value is None else value], min_val, avg_val, max_val, max_score)[0])
+
+    def calculate_score(self):
+        return int(score_batch([feature_vector(self.analyses)])[0])
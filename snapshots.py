@@ -0,0 +1,90 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from starlette.concurrency import run_in_threadpool
+from database import AsyncSessionLocal, SessionLocal
+from models.score_snapshot import ScoreSnapshot
+from scoring import MODEL_VERSION
+import config as settings
+
+def snapshot_etag(model_version: str, features: list) -> str:
+    digest = hashlib.sha256(json.dumps([model_version, features]).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+def build_snapshot(address: str, chain: str, tx_limit: int, features: list, details: dict, score: int) -> ScoreSnapshot:
+    return ScoreSnapshot(
+        address=address,
+        chain=chain,
+        tx_limit=tx_limit,
+        model_version=MODEL_VERSION,
+        features=features,
+        details=details,
+        score=score,
+        computed_at=datetime.now(timezone.utc),
+    )
+
+def latest_snapshot_query(address: str, chain: str, tx_limit: int):
+    return select(ScoreSnapshot).where(
+        ScoreSnapshot.chain == chain,
+        ScoreSnapshot.address == address,
+        ScoreSnapshot.tx_limit == tx_limit,
+        ScoreSnapshot.model_version == MODEL_VERSION,
+    )
+
+def upsert_snapshot_stmt(snapshot: ScoreSnapshot):
+    # One row per (chain, address, tx_limit, model_version): rescoring
+    # replaces the previous snapshot instead of growing the table.
+    stmt = insert(ScoreSnapshot).values(
+        address=snapshot.address,
+        chain=snapshot.chain,
+        tx_limit=snapshot.tx_limit,
+        model_version=snapshot.model_version,
+        features=snapshot.features,
+        details=snapshot.details,
+        score=snapshot.score,
+        computed_at=snapshot.computed_at,
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[ScoreSnapshot.chain, ScoreSnapshot.address, ScoreSnapshot.tx_limit, ScoreSnapshot.model_version],
+        set_={
+            "features": stmt.excluded.features,
+            "details": stmt.excluded.details,
+            "score": stmt.excluded.score,
+            "computed_at": stmt.excluded.computed_at,
+        },
+    )
+
+def write_snapshot(snapshot: ScoreSnapshot):
+    with SessionLocal() as db:
+        db.execute(upsert_snapshot_stmt(snapshot))
+        db.commit()
+
+def read_latest_snapshot(address: str, chain: str, tx_limit: int):
+    with SessionLocal() as db:
+        return db.scalars(latest_snapshot_query(address, chain, tx_limit)).first()
+
+async def save_snapshot(address: str, chain: str, tx_limit: int, features: list, details: dict, score: int):
+    snapshot = build_snapshot(address, chain, tx_limit, features, details, score)
+    if AsyncSessionLocal is None:
+        await run_in_threadpool(write_snapshot, snapshot)
+        return
+    async with AsyncSessionLocal() as db:
+        await db.execute(upsert_snapshot_stmt(snapshot))
+        await db.commit()
+
+async def get_latest_snapshot(address: str, chain: str, tx_limit: int):
+    if AsyncSessionLocal is None:
+        return await run_in_threadpool(read_latest_snapshot, address, chain, tx_limit)
+    async with AsyncSessionLocal() as db:
+        return (await db.scalars(latest_snapshot_query(address, chain, tx_limit))).first()
+
+def snapshot_age_seconds(snapshot: ScoreSnapshot) -> float:
+    computed_at = snapshot.computed_at
+    if computed_at.tzinfo is None:
+        computed_at = computed_at.replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - computed_at).total_seconds()
+
+def is_fresh(snapshot: ScoreSnapshot) -> bool:
+    return snapshot_age_seconds(snapshot) < settings.SCORE_SNAPSHOT_TTL
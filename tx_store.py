@@ -0,0 +1,142 @@
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from starlette.concurrency import run_in_threadpool
+from database import SessionLocal
+from models.transaction import Transaction, WalletTransaction
+from models.sync_cursor import WalletSyncCursor
+from goldrush import iter_goldrush_transactions
+import config as settings
+
+def get_sync_cursor(chain: str, address: str):
+    with SessionLocal() as db:
+        return db.get(WalletSyncCursor, (chain, address))
+
+def store_transactions(chain: str, address: str, txs: list):
+    rows = [tx for tx in txs if tx.get("tx_hash")]
+    if not rows:
+        return
+
+    with SessionLocal() as db:
+        db.execute(
+            insert(Transaction).on_conflict_do_nothing(),
+            [
+                {"chain": chain, "tx_hash": tx["tx_hash"], "block_height": tx.get("block_height"), "data": tx}
+                for tx in rows
+            ],
+        )
+        db.execute(
+            insert(WalletTransaction).on_conflict_do_nothing(),
+            [
+                {"chain": chain, "address": address, "tx_hash": tx["tx_hash"], "block_height": tx.get("block_height")}
+                for tx in rows
+            ],
+        )
+        db.commit()
+
+def update_sync_cursor(
+    chain: str,
+    address: str,
+    last_block_height: int = None,
+    backfill_limit: int = None,
+    history_complete: bool = None,
+):
+    stmt = insert(WalletSyncCursor).values(
+        chain=chain,
+        address=address,
+        last_block_height=last_block_height,
+        backfill_limit=backfill_limit if backfill_limit is not None else 0,
+        history_complete=history_complete if backfill_limit is not None else False,
+    )
+    # Upsert so concurrent first syncs of the same wallet cannot race on the
+    # insert; the height only ever moves forward.
+    updates = {
+        "last_block_height": func.greatest(WalletSyncCursor.last_block_height, stmt.excluded.last_block_height),
+        "last_synced_at": func.now(),
+    }
+    if backfill_limit is not None:
+        updates["backfill_limit"] = stmt.excluded.backfill_limit
+        updates["history_complete"] = stmt.excluded.history_complete
+
+    with SessionLocal() as db:
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[WalletSyncCursor.chain, WalletSyncCursor.address],
+            set_=updates,
+        ))
+        db.commit()
+
+def scan_transactions(chain: str, address: str, limit: int, extractor, keep_txs: bool = True):
+    txs = [] if keep_txs else None
+    stmt = (
+        select(Transaction.data)
+        .join(
+            WalletTransaction,
+            (WalletTransaction.chain == Transaction.chain)
+            & (WalletTransaction.tx_hash == Transaction.tx_hash),
+        )
+        .where(WalletTransaction.chain == chain, WalletTransaction.address == address)
+        .order_by(WalletTransaction.block_height.desc().nullslast())
+        .limit(limit)
+        .execution_options(yield_per=settings.TX_STORE_SCAN_BATCH)
+    )
+
+    with SessionLocal() as db:
+        for partition in db.execute(stmt).partitions():
+            for (tx,) in partition:
+                extractor.add(tx)
+                if keep_txs:
+                    txs.append(tx)
+
+    return txs
+
+def _max_height(txs: list, current: int = None):
+    heights = [tx["block_height"] for tx in txs if tx.get("block_height") is not None]
+    if current is not None:
+        heights.append(current)
+    return max(heights) if heights else None
+
+async def full_sync(address: str, chain: str, tx_limit: int):
+    count = 0
+    last_block_height = None
+    async for page in iter_goldrush_transactions(address, chain, tx_limit):
+        await run_in_threadpool(store_transactions, chain, address, page)
+        count += len(page)
+        last_block_height = _max_height(page, last_block_height)
+
+    await run_in_threadpool(
+        update_sync_cursor, chain, address, last_block_height, tx_limit, count < tx_limit
+    )
+
+async def delta_sync(address: str, chain: str, tx_limit: int, last_block_height: int):
+    count = 0
+    newest = None
+    reached_cursor = False
+    async for page in iter_goldrush_transactions(address, chain, tx_limit):
+        if last_block_height is None:
+            new_txs = page
+        else:
+            new_txs = [tx for tx in page if (tx.get("block_height") or 0) >= last_block_height]
+        await run_in_threadpool(store_transactions, chain, address, new_txs)
+        count += len(new_txs)
+        newest = _max_height(new_txs, newest)
+        if len(new_txs) < len(page):
+            reached_cursor = True
+            break
+
+    # The cursor only moves once the whole delta is stored, so an interrupted
+    # sync is retried instead of leaving a gap behind a newer cursor.
+    if reached_cursor:
+        await run_in_threadpool(update_sync_cursor, chain, address, newest)
+    else:
+        await run_in_threadpool(
+            update_sync_cursor, chain, address, newest, tx_limit, count < tx_limit
+        )
+
+async def load_transactions(address: str, chain: str, tx_limit: int, extractor, keep_txs: bool = True):
+    cursor = await run_in_threadpool(get_sync_cursor, chain, address)
+
+    if cursor is None or (not cursor.history_complete and cursor.backfill_limit < tx_limit):
+        await full_sync(address, chain, tx_limit)
+    else:
+        await delta_sync(address, chain, tx_limit, cursor.last_block_height)
+
+    return await run_in_threadpool(scan_transactions, chain, address, tx_limit, extractor, keep_txs)
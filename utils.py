@@ -1,39 +1,69 @@
-from covalent import CovalentClient
-import requests
+from functools import lru_cache
 import config as settings
-from routes.chains import chains
-from routes.score import GOLDRUSH_BASE_URL, HEADERS
+from routes.chains import chain_registry
+from cache import EntryCache
+from goldrush import get_goldrush_transactions_page
+import httpx
+import metrics
 import secrets
 import string
 
-covalent_client = CovalentClient(settings.COVALENT_API_KEY)
+@lru_cache(maxsize=1)
+def get_covalent_client():
+    from covalent import CovalentClient
+
+    return CovalentClient(settings.COVALENT_API_KEY)
 
 def is_supported_chain(chain_symbol: str) -> bool:
-    return chain_symbol.lower() in chains
+    return chain_registry.is_supported(chain_symbol)
 
 def is_valid_address(address: str) -> bool:
     from web3 import Web3
 
     return Web3.is_address(address)
 
-def can_fetch_data_from_goldrush(address: str, chain: str) -> bool:
+# Auth failures, timeouts and rate limits say nothing about the wallet itself.
+TRANSIENT_STATUSES = {401, 403, 408, 429}
+
+verified_wallets = EntryCache(settings.VERIFY_CACHE_TTL, settings.VERIFY_CACHE_MAX_ENTRIES)
+rejected_wallets = EntryCache(settings.VERIFY_NEGATIVE_CACHE_TTL, settings.VERIFY_CACHE_MAX_ENTRIES)
+metrics.register("wallet_verification", lambda: {
+    "verified": verified_wallets.stats(),
+    "rejected": rejected_wallets.stats(),
+})
+
+def verification_key(address: str, chain: str) -> tuple:
+    return chain.lower(), address.lower()
+
+def is_verification_cached(address: str, chain: str) -> bool:
+    key = verification_key(address, chain)
+    return key in verified_wallets or key in rejected_wallets
+
+async def can_fetch_data_from_goldrush(address: str, chain: str) -> bool:
+    key = verification_key(address, chain)
+    chain, address = key
+    if verified_wallets.get(key):
+        return True
+    if rejected_wallets.get(key):
+        return False
+
+    # Same page the first score request asks for, so verifying a wallet also
+    # warms the GoldRush cache for its score.
     try:
-        url = f"{GOLDRUSH_BASE_URL}/allchains/transactions/"
-        params = {
-            "chains": chain,
-            "addresses": address,
-            "limit": 1,
-            "no-logs": "true"
-        }
-        resp = requests.get(url, headers=HEADERS, params=params)
-        resp.raise_for_status()
-        data = resp.json().get("data", {})
-
-        if "items" in data and isinstance(data["items"], list):
-            return True
+        data = await get_goldrush_transactions_page(address, chain, settings.GOLDRUSH_PAGE_SIZE)
+    except httpx.HTTPStatusError as e:
+        status = e.response.status_code
+        if status < 500 and status not in TRANSIENT_STATUSES:
+            rejected_wallets.set(key, True)
+        return False
     except Exception:
         return False
 
+    if isinstance(data.get("items"), list):
+        verified_wallets.set(key, True)
+        return True
+
+    rejected_wallets.set(key, True)
     return False
 
 def generate_api_key(length: int = 24) -> str: